@@ -0,0 +1,5 @@
+# Local application imports
+from apps.common.pagination.cursor import OPTIONAL_CURSOR_PAGINATION_PARAMETERS, OptionalCursorPagination
+
+# Exports
+__all__ = ["OPTIONAL_CURSOR_PAGINATION_PARAMETERS", "OptionalCursorPagination"]
@@ -0,0 +1,47 @@
+# Third-party imports
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.pagination import CursorPagination
+
+# Schema parameters for views paginated with OptionalCursorPagination
+OPTIONAL_CURSOR_PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        name="page_size",
+        description="Number of results per page, up to 100. Omit to return the full list unpaginated.",
+        required=False,
+        type=int,
+    ),
+    OpenApiParameter(
+        name="cursor",
+        description="Cursor from the next or previous link of a paginated response.",
+        required=False,
+        type=str,
+    ),
+]
+
+
+# Cursor pagination that is only applied on request
+class OptionalCursorPagination(CursorPagination):
+    """Cursor pagination that is only applied when the client asks for a page size.
+
+    Without a page_size query parameter, paginate_queryset() returns None and views keep
+    returning their full list, so existing clients are unaffected. With it, results are
+    ordered newest first and split into pages linked by opaque cursors.
+
+    Attributes:
+        page_size (int | None): The default page size, None to disable pagination.
+        page_size_query_param (str): The query parameter that sets the page size.
+        max_page_size (int): The largest page size a client may request.
+        ordering (str): The ordering used to build the cursors.
+    """
+
+    # Do not paginate unless a page size is requested
+    page_size = None
+
+    # Query parameter that sets the page size
+    page_size_query_param = "page_size"
+
+    # Largest page size a client may request
+    max_page_size = 100
+
+    # Order newest first
+    ordering = "-created_at"
@@ -1,11 +1,14 @@
 # Standard library imports
-import json
 from typing import Any
 
 # Third-party imports
+import orjson
 from django.utils.translation import gettext_lazy as _
 from rest_framework.renderers import JSONRenderer
 
+# Options for orjson, passing dates through to DRF's encoder so their format is unchanged
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 # Custom JSON renderer for API responses
 class GenericJSONRenderer(JSONRenderer):
@@ -13,7 +16,9 @@ class GenericJSONRenderer(JSONRenderer):
 
     This renderer extends DRF's JSONRenderer to provide a consistent response structure
     for all API endpoints. It wraps the response data in a standardized format
-    with status code and object label.
+    with status code and object label. The payload is encoded with orjson, which handles
+    strings, numbers, containers and UUIDs natively, while values such as dates and lazy
+    translation strings fall back to DRF's JSON encoder.
 
     Attributes:
         charset (str): Character encoding for the rendered content.
@@ -75,19 +80,18 @@ class GenericJSONRenderer(JSONRenderer):
 
         # If error in data
         if "error" in data:
-            # Return the error response
-            return json.dumps(
-                {"status_code": status_code, "error": data["error"]},
-            ).encode(self.charset)
+            # Build the error response
+            payload = {"status_code": status_code, "error": data["error"]}
 
         # If errors in data
-        if "errors" in data:
-            # Return the error response
-            return json.dumps(
-                {"status_code": status_code, "errors": data["errors"]},
-            ).encode(self.charset)
-
-        # Return standardized response format
-        return json.dumps({"status_code": status_code, object_label: data}).encode(
-            self.charset,
-        )
+        elif "errors" in data:
+            # Build the errors response
+            payload = {"status_code": status_code, "errors": data["errors"]}
+
+        # Otherwise
+        else:
+            # Build the standardized response format
+            payload = {"status_code": status_code, object_label: data}
+
+        # Return the encoded response
+        return orjson.dumps(payload, default=self.encoder_class().default, option=ORJSON_OPTIONS)
@@ -1,5 +1,7 @@
 # Local application imports
+from apps.common.serializers.cached_fields import CachedFieldsMixin
+from apps.common.serializers.representation import build_field_readers, format_datetime
 from apps.common.serializers.response import GenericResponseSerializer
 
 # Exports
-__all__ = ["GenericResponseSerializer"]
+__all__ = ["CachedFieldsMixin", "GenericResponseSerializer", "build_field_readers", "format_datetime"]
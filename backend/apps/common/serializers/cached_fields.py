@@ -0,0 +1,44 @@
+# Standard library imports
+import copy
+from typing import ClassVar
+
+# Third-party imports
+from rest_framework.fields import Field
+
+
+# Serializer mixin that caches field construction per class
+class CachedFieldsMixin:
+    """Mixin that builds a serializer's fields once per serializer class.
+
+    DRF rebuilds every field, including a deep copy of the declared fields, each time
+    a serializer is instantiated. This mixin keeps the result of the first get_fields()
+    call for each serializer class and hands out shallow copies of those field templates
+    afterwards. It is only safe for serializers whose fields do not depend on the
+    instance, the data or the context.
+
+    Attributes:
+        _fields_cache (dict): The field templates keyed by serializer class.
+    """
+
+    # Field templates keyed by serializer class
+    _fields_cache: ClassVar[dict[type, dict[str, Field]]] = {}
+
+    # Return the fields for this serializer instance
+    def get_fields(self) -> dict[str, Field]:
+        """Return the fields for this serializer instance.
+
+        Returns:
+            dict[str, Field]: Fresh, unbound copies of the cached field templates.
+        """
+
+        # Get the cached field templates for the serializer class
+        templates = self._fields_cache.get(type(self))
+
+        # Build the field templates on first use
+        if templates is None:
+            # Let DRF build the fields and cache them for the class
+            templates = super().get_fields()
+            self._fields_cache[type(self)] = templates
+
+        # Return a shallow copy of each template so binding never touches the cache
+        return {name: copy.copy(field) for name, field in templates.items()}
@@ -0,0 +1,103 @@
+# Standard library imports
+from collections.abc import Callable
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from typing import Any
+
+# Third-party imports
+from django.db import models
+from rest_framework import serializers
+
+# DRF datetime field shared by the dict builders that mirror serializer output
+_datetime_field = serializers.DateTimeField()
+
+
+# Format a datetime like a DRF serializer
+def format_datetime(value: datetime | None) -> str | None:
+    """Format a datetime exactly like a DRF DateTimeField.
+
+    Dict builders that bypass a serializer use this so their timestamps match the
+    serializer's output, including the configured time zone and format.
+
+    Args:
+        value (datetime | None): The datetime to format.
+
+    Returns:
+        str | None: The formatted datetime, or None if there is no value.
+    """
+
+    # Format the value through the shared DRF field
+    return _datetime_field.to_representation(value)
+
+
+# Wrap a reader so its datetime value is formatted
+def _datetime_reader(read: Callable[[Any], datetime | None]) -> Callable[[Any], str | None]:
+    """Wrap a reader so the datetime it returns is formatted with format_datetime.
+
+    Args:
+        read (Callable[[Any], datetime | None]): The reader returning the raw datetime.
+
+    Returns:
+        Callable[[Any], str | None]: The reader returning the formatted datetime.
+    """
+
+    # Return the formatting reader
+    return lambda source: format_datetime(read(source))
+
+
+# Build the value readers for a model serializer's fields
+def build_field_readers(
+    serializer_class: type[serializers.ModelSerializer],
+    overrides: dict[str, Callable[[Any], Any]] | None = None,
+    *,
+    from_rows: bool = False,
+) -> dict[str, Callable[[Any], Any]]:
+    """Build one value reader per field of a model serializer, in Meta.fields order.
+
+    Dict builders apply these readers to produce the serializer's representation without
+    instantiating it. The keys come from the serializer's Meta.fields, so a field added to
+    the serializer is also added to the builder's output. Fields without an override read
+    the attribute, or the values() row key, of the same name, and model datetime fields
+    are formatted with format_datetime.
+
+    Args:
+        serializer_class (type[serializers.ModelSerializer]): The serializer to mirror.
+        overrides (dict[str, Callable[[Any], Any]] | None): Readers for fields that are not
+            a plain attribute or column of the same name, such as nested representations.
+        from_rows (bool): Whether the readers are applied to values() rows instead of
+            model instances.
+
+    Returns:
+        dict[str, Callable[[Any], Any]]: The value readers keyed by field name.
+    """
+
+    # Default to no overrides
+    overrides = overrides or {}
+
+    # Get the model the serializer represents
+    model = serializer_class.Meta.model
+
+    # Initialize the readers
+    readers = {}
+
+    # Build a reader for each serializer field
+    for name in serializer_class.Meta.fields:
+        # Use the override if the field has one
+        if name in overrides:
+            # Set the override reader
+            readers[name] = overrides[name]
+
+            # Move on to the next field
+            continue
+
+        # Read the row key or attribute of the same name
+        read = itemgetter(name) if from_rows else attrgetter(name)
+
+        # Get the model field behind the attribute, if there is one
+        model_field = getattr(getattr(model, name, None), "field", None)
+
+        # Format model datetime fields like the serializer
+        readers[name] = _datetime_reader(read) if isinstance(model_field, models.DateTimeField) else read
+
+    # Return the readers
+    return readers
@@ -1,6 +1,16 @@
 # Local application imports
 from apps.common.utils.email import send_templated_mail
+from apps.common.utils.exceptions import EXCEPTION_STATUS_CODES, get_exception_status_code
+from apps.common.utils.validators import is_valid_uuid
 from apps.common.utils.vault import delete_api_key, get_api_key, store_api_key
 
 # Exports
-__all__ = ["delete_api_key", "get_api_key", "send_templated_mail", "store_api_key"]
+__all__ = [
+    "EXCEPTION_STATUS_CODES",
+    "delete_api_key",
+    "get_api_key",
+    "get_exception_status_code",
+    "is_valid_uuid",
+    "send_templated_mail",
+    "store_api_key",
+]
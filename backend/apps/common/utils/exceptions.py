@@ -0,0 +1,41 @@
+# Third-party imports
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed, NotFound, PermissionDenied
+from rest_framework_simplejwt.exceptions import TokenError
+
+# Status codes for exceptions whose error response needs a specific status
+EXCEPTION_STATUS_CODES: dict[type[Exception], int] = {
+    AuthenticationFailed: status.HTTP_401_UNAUTHORIZED,
+    TokenError: status.HTTP_401_UNAUTHORIZED,
+    PermissionDenied: status.HTTP_403_FORBIDDEN,
+    NotFound: status.HTTP_404_NOT_FOUND,
+}
+
+
+# Get the response status code for an exception
+def get_exception_status_code(exc: Exception) -> int:
+    """Get the response status code for an exception.
+
+    The exception's class hierarchy is walked so subclasses such as InvalidToken resolve
+    to the status of their mapped base class. Unmapped exceptions fall back to their own
+    status code, or to 500 if they have none.
+
+    Args:
+        exc (Exception): The exception to get the status code for.
+
+    Returns:
+        int: The HTTP status code for the error response.
+    """
+
+    # Walk the exception's class hierarchy
+    for cls in type(exc).__mro__:
+        # Get the mapped status code for the class
+        status_code = EXCEPTION_STATUS_CODES.get(cls)
+
+        # Return the mapped status code if there is one
+        if status_code is not None:
+            # Return the status code
+            return status_code
+
+    # Return the exception's own status code or 500
+    return getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR)
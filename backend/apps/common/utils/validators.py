@@ -0,0 +1,28 @@
+# Standard library imports
+import uuid
+
+
+# Check whether a value is a valid UUID
+def is_valid_uuid(value: object) -> bool:
+    """Check whether a value is a valid UUID.
+
+    Views use this to reject malformed identifiers before querying, as the database
+    would otherwise fail to parse them and the request would end in a server error.
+
+    Args:
+        value (object): The value to check, usually a URL or query parameter.
+
+    Returns:
+        bool: True if the value parses as a UUID, False otherwise.
+    """
+
+    try:
+        # Parse the value as a UUID
+        uuid.UUID(str(value))
+
+    except ValueError:
+        # Return False if the value is not a valid UUID
+        return False
+
+    # Return True if the value is a valid UUID
+    return True
@@ -0,0 +1,5 @@
+# Local application imports
+from apps.common.views.exception import CustomExceptionMixin
+
+# Exports
+__all__ = ["CustomExceptionMixin"]
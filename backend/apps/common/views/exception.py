@@ -0,0 +1,32 @@
+# Third-party imports
+from rest_framework.response import Response
+
+# Local application imports
+from apps.common.utils import get_exception_status_code
+
+
+# Custom exception mixin
+class CustomExceptionMixin:
+    """Custom exception mixin.
+
+    Renders every exception raised by an API view as an error response, with the status
+    code resolved through the shared exception status mapping. Views that need a custom
+    envelope for a specific exception can override handle_exception and call super().
+    """
+
+    # Override the handle_exception method to customize error responses
+    def handle_exception(self, exc: Exception) -> Response:
+        """Return the error response for an exception.
+
+        Args:
+            exc (Exception): The exception that occurred.
+
+        Returns:
+            Response: The HTTP response object.
+        """
+
+        # Return the exception as an error response
+        return Response(
+            {"error": str(exc)},
+            status=get_exception_status_code(exc),
+        )
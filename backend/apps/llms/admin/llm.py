@@ -17,6 +17,7 @@ class LLMAdmin(admin.ModelAdmin):
 
     Attributes:
         list_display (list): Fields to display in the list view.
+        list_select_related (list): Related fields to join in the list view.
         list_filter (list): Fields to filter by in the list view.
         search_fields (list): Fields to search in the list view.
         fieldsets (list): Fieldsets to display in the detail view.
@@ -35,6 +36,9 @@ class LLMAdmin(admin.ModelAdmin):
         "created_at",
     ]
 
+    # Related fields to join in the list view (nullable foreign keys are not joined by default)
+    list_select_related = ["organization", "user"]
+
     # Fields that can be used for filtering in the admin
     list_filter = ["base_url", "model", "created_at", "organization"]
 
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.13 on 2026-10-18 08:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('llms', '0003_initial'),
+        ('organization', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='llm',
+            constraint=models.CheckConstraint(check=models.Q(('model', ''), _negated=True), name='llm_model_not_empty'),
+        ),
+    ]
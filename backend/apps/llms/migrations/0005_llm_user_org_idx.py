@@ -0,0 +1,23 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:07
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('llms', '0004_llm_model_not_empty'),
+        ('organization', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='llm',
+            index=models.Index(fields=['user', 'organization'], name='llm_user_org_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 # Local application imports
@@ -33,6 +34,7 @@ class LLM(TimeStampedModel):
         verbose_name_plural (str): Human-readable plural name for the model.
         ordering (list): Default ordering for model instances.
         db_table (str): The database table name.
+        constraints (list): Database-level constraints for the model.
     """
 
     # Base URL for the LLM API
@@ -94,6 +96,8 @@ class LLM(TimeStampedModel):
             verbose_name_plural (str): Human-readable plural name for the model.
             ordering (list): Default ordering for model instances.
             db_table (str): The database table name.
+            constraints (list): Database-level constraints for the model.
+            indexes (list): Database indexes for the model.
         """
 
         # Human-readable model name
@@ -108,6 +112,22 @@ class LLM(TimeStampedModel):
         # Specify the database table name
         db_table = "llms_llm"
 
+        # Enforce a non-empty model name in the database regardless of the write path
+        constraints = [
+            models.CheckConstraint(
+                check=~Q(model=""),
+                name="llm_model_not_empty",
+            ),
+        ]
+
+        # Index the user and organization pair used to list a user's LLMs in an organization
+        indexes = [
+            models.Index(
+                fields=["user", "organization"],
+                name="llm_user_org_idx",
+            ),
+        ]
+
     # String representation of the LLM configuration
     def __str__(self) -> str:
         """Return a string representation of the LLM configuration.
@@ -147,6 +167,9 @@ class LLM(TimeStampedModel):
             # Store the API key in Vault
             store_api_key("llm", str(self.pk), self.api_key)
 
+            # Drop the memoized Vault lookup since the stored key changed
+            self.__dict__.pop("_vault_api_key", None)
+
             # Clear the API key field before saving to the database
             self.api_key = ""
 
@@ -158,6 +181,9 @@ class LLM(TimeStampedModel):
     def get_api_key(self) -> str:
         """Retrieve the API key from Vault.
 
+        The result is memoized on the instance, so repeated checks within a request
+        (validation, model cleaning, admin rendering) only hit Vault once.
+
         Returns:
             str: The API key if found, empty string otherwise.
         """
@@ -166,8 +192,12 @@ class LLM(TimeStampedModel):
         if not self.pk:
             return ""
 
+        # Fetch the API key from Vault only on first use
+        if "_vault_api_key" not in self.__dict__:
+            self.__dict__["_vault_api_key"] = get_api_key("llm", str(self.pk)) or ""
+
         # Return the API key if found, empty string otherwise
-        return get_api_key("llm", str(self.pk)) or ""
+        return self.__dict__["_vault_api_key"]
 
     # Delete the API key from Vault
     def delete(self, *args, **kwargs) -> None:
@@ -180,6 +210,9 @@ class LLM(TimeStampedModel):
         if self.pk:
             delete_api_key("llm", str(self.pk))
 
+            # Drop the memoized Vault lookup
+            self.__dict__.pop("_vault_api_key", None)
+
         # Call the parent delete method
         super().delete(*args, **kwargs)
 
@@ -1,6 +1,13 @@
 # Local application imports
-from apps.llms.serializers.llm import LLMResponseSchema, LLMSerializer
+from apps.llms.serializers.llm import (
+    LLM_LIST_VALUES_FIELDS,
+    LLMResponseSchema,
+    LLMSerializer,
+    serialize_llm_list,
+    serialize_llm_rows,
+)
 from apps.llms.serializers.llm_create import (
+    LLM_AUTH_ERROR_RESPONSES,
     LLMAuthErrorResponseSerializer,
     LLMCreateErrorResponseSerializer,
     LLMCreateSerializer,
@@ -28,6 +35,8 @@ from apps.llms.serializers.llm_update import (
 
 # Exports
 __all__ = [
+    "LLM_AUTH_ERROR_RESPONSES",
+    "LLM_LIST_VALUES_FIELDS",
     "LLMAuthErrorResponseSerializer",
     "LLMCreateErrorResponseSerializer",
     "LLMCreateSerializer",
@@ -47,4 +56,6 @@ __all__ = [
     "LLMUpdateErrorResponseSerializer",
     "LLMUpdateSerializer",
     "LLMUpdateSuccessResponseSerializer",
+    "serialize_llm_list",
+    "serialize_llm_rows",
 ]
@@ -1,9 +1,14 @@
+# Standard library imports
+from collections.abc import Iterable
+
 # Third-party imports
+from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 # Local application imports
+from apps.common.serializers import CachedFieldsMixin, build_field_readers
 from apps.llms.models import LLM
 
 
@@ -59,7 +64,7 @@ class LLMUserSerializer(serializers.Serializer):
 
 
 # LLM serializer
-class LLMSerializer(serializers.ModelSerializer):
+class LLMSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """LLM serializer.
 
     This serializer provides a representation of the LLM model.
@@ -244,3 +249,112 @@ class LLMResponseSchema(serializers.Serializer):
         required=False,
         allow_null=True,
     )
+
+
+# Read the nested organization of a flat LLM row
+def _read_row_organization(row: dict) -> dict | None:
+    """Read the organization details of a flat LLM row like LLMSerializer.
+
+    Args:
+        row (dict): The row selected with LLM_LIST_VALUES_FIELDS.
+
+    Returns:
+        dict | None: The organization details, or None if the LLM has no organization.
+    """
+
+    # Return no organization if the LLM has none
+    if not row["organization_id"]:
+        # Return None
+        return None
+
+    # Return the organization details
+    return {
+        "id": row["organization_id"],
+        "name": row["organization__name"],
+    }
+
+
+# Read the nested user of a flat LLM row
+def _read_row_user(row: dict) -> dict | None:
+    """Read the user details of a flat LLM row like LLMSerializer.
+
+    Args:
+        row (dict): The row selected with LLM_LIST_VALUES_FIELDS.
+
+    Returns:
+        dict | None: The user details, or None if the LLM has no user.
+    """
+
+    # Return no user if the LLM has none
+    if not row["user_id"]:
+        # Return None
+        return None
+
+    # Return the user details
+    return {
+        "id": row["user_id"],
+        "username": row["user__username"],
+        "email": row["user__email"],
+    }
+
+
+# Readers for the LLMSerializer fields nested from joined columns
+_LLM_ROW_NESTED_READERS = {
+    "organization": _read_row_organization,
+    "user": _read_row_user,
+}
+
+# Columns selected by the flat LLM list projection, every plain LLMSerializer field plus the joined details
+LLM_LIST_VALUES_FIELDS = (
+    *(field for field in LLMSerializer.Meta.fields if field not in _LLM_ROW_NESTED_READERS),
+    "organization_id",
+    "organization__name",
+    "user_id",
+    "user__username",
+    "user__email",
+)
+
+# Readers building each LLMSerializer field from a flat row, keyed in the serializer's field order
+_LLM_ROW_READERS = build_field_readers(LLMSerializer, _LLM_ROW_NESTED_READERS, from_rows=True)
+
+# Number of rows fetched per database round trip when streaming an unpaginated LLM list
+LLM_LIST_CHUNK_SIZE = 500
+
+
+# Serialize an LLM queryset through a flat values() projection
+def serialize_llm_list(queryset: QuerySet) -> list[dict]:
+    """Serialize an LLM queryset into dictionaries shaped like LLMSerializer output.
+
+    The queryset is evaluated with values(), so the organization and user details are
+    fetched through a single JOIN and no model instances or per-row serializer fields
+    are built. Rows are streamed in chunks of LLM_LIST_CHUNK_SIZE rather than cached on
+    the queryset, so only the serialized output is held for large lists. IDs are left as
+    UUIDs for the renderer's JSON encoder, so the rendered output matches LLMResponseSchema.
+
+    Args:
+        queryset (QuerySet): The LLM queryset to serialize.
+
+    Returns:
+        list[dict]: The serialized LLM configurations.
+    """
+
+    # Serialize the rows of the flat projection as they are streamed from the database
+    return serialize_llm_rows(queryset.values(*LLM_LIST_VALUES_FIELDS).iterator(chunk_size=LLM_LIST_CHUNK_SIZE))
+
+
+# Serialize rows of the flat LLM projection
+def serialize_llm_rows(rows: Iterable[dict]) -> list[dict]:
+    """Serialize rows selected with LLM_LIST_VALUES_FIELDS into LLMSerializer-shaped dictionaries.
+
+    This lets callers that slice or paginate the values() queryset themselves reuse the
+    same representation as serialize_llm_list().
+
+    Args:
+        rows (Iterable[dict]): The rows selected with LLM_LIST_VALUES_FIELDS.
+
+    Returns:
+        list[dict]: The serialized LLM configurations.
+    """
+
+    # Build the representation of each flat row from the serializer's fields
+    return [{field: read(row) for field, read in _LLM_ROW_READERS.items()} for row in rows]
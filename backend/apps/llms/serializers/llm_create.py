@@ -1,16 +1,17 @@
 # Third-party imports
+from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers, status
 
 # Local application imports
-from apps.common.serializers import GenericResponseSerializer
+from apps.common.serializers import CachedFieldsMixin, GenericResponseSerializer
 from apps.llms.models import LLM
 from apps.llms.serializers.llm import LLMResponseSchema
 from apps.organization.models import Organization
 
 
 # LLM creation serializer
-class LLMCreateSerializer(serializers.ModelSerializer):
+class LLMCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """LLM creation serializer.
 
     This serializer handles the creation of new LLM configurations. It validates that
@@ -110,29 +111,29 @@ class LLMCreateSerializer(serializers.ModelSerializer):
             # Try to get the organization
             organization = Organization.objects.get(id=organization_id)
 
-            # Check if the user is a member of the organization
-            if user not in organization.members.all() and user != organization.owner:
+            # Check if the user is the owner or a member of the organization
+            if organization.owner_id != user.id and not organization.members.filter(id=user.id).exists():
                 # Raise a validation error
                 raise serializers.ValidationError(
                     {
                         "organization_id": [
-                            _("You are not a member of this organization."),
+                            gettext("You are not a member of this organization."),
                         ],
                     },
                 ) from None
 
-            # Validate model name is provided
+            # Validate model name is provided (friendly error, the database enforces it too)
             if not model:
                 # Raise a validation error
                 raise serializers.ValidationError(
-                    {"model": [_("Model name is required.")]},
+                    {"model": [gettext("Model name is required.")]},
                 ) from None
 
             # Check if API key is provided
             if not api_key:
                 # Raise a validation error
                 raise serializers.ValidationError(
-                    {"api_key": [_("API key is required.")]},
+                    {"api_key": [gettext("API key is required.")]},
                 ) from None
 
             # Store the organization in attrs for later use
@@ -149,7 +150,7 @@ class LLMCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 {
                     "organization_id": [
-                        _("Organization not found."),
+                        gettext("Organization not found."),
                     ],
                 },
             ) from None
@@ -213,6 +214,62 @@ class LLMCreateSuccessResponseSerializer(GenericResponseSerializer):
     )
 
 
+# LLM creation errors detail serializer
+class LLMCreateErrorsDetailSerializer(serializers.Serializer):
+    """LLM Creation Errors detail serializer.
+
+    Attributes:
+        organization_id (list): Errors related to the organization ID field.
+        base_url (list): Errors related to the base URL field.
+        model (list): Errors related to the model field.
+        api_key (list): Errors related to the API key field.
+        max_tokens (list): Errors related to the max tokens field.
+        non_field_errors (list): Non-field specific errors.
+    """
+
+    # Organization ID field
+    organization_id = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the organization ID field."),
+    )
+
+    # Base URL field
+    base_url = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the base URL field."),
+    )
+
+    # Model field
+    model = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the model field."),
+    )
+
+    # API key field
+    api_key = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the API key field."),
+    )
+
+    # Max tokens field
+    max_tokens = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the max tokens field."),
+    )
+
+    # Non-field errors
+    non_field_errors = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Non-field specific errors."),
+    )
+
+
 # LLM creation error response serializer
 class LLMCreateErrorResponseSerializer(GenericResponseSerializer):
     """LLM creation error response serializer (for schema).
@@ -232,61 +289,6 @@ class LLMCreateErrorResponseSerializer(GenericResponseSerializer):
         help_text=_("HTTP status code for the response."),
     )
 
-    # Nested serializer defining the structure of the actual errors
-    class LLMCreateErrorsDetailSerializer(serializers.Serializer):
-        """LLM Creation Errors detail serializer.
-
-        Attributes:
-            organization_id (list): Errors related to the organization ID field.
-            base_url (list): Errors related to the base URL field.
-            model (list): Errors related to the model field.
-            api_key (list): Errors related to the API key field.
-            max_tokens (list): Errors related to the max tokens field.
-            non_field_errors (list): Non-field specific errors.
-        """
-
-        # Organization ID field
-        organization_id = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the organization ID field."),
-        )
-
-        # Base URL field
-        base_url = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the base URL field."),
-        )
-
-        # Model field
-        model = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the model field."),
-        )
-
-        # API key field
-        api_key = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the API key field."),
-        )
-
-        # Max tokens field
-        max_tokens = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the max tokens field."),
-        )
-
-        # Non-field errors
-        non_field_errors = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Non-field specific errors."),
-        )
-
     # Define the 'errors' field containing the validation error details
     errors = LLMCreateErrorsDetailSerializer(
         help_text=_("Object containing validation errors."),
@@ -319,3 +321,9 @@ class LLMAuthErrorResponseSerializer(GenericResponseSerializer):
         read_only=True,
         help_text=_("Error message explaining the authentication failure."),
     )
+
+
+# Authentication error responses shared by the LLM view schemas
+LLM_AUTH_ERROR_RESPONSES = {
+    status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+}
@@ -4,7 +4,7 @@ from rest_framework import serializers, status
 
 # Local application imports
 from apps.common.serializers import GenericResponseSerializer
-from apps.llms.serializers.llm import LLMSerializer
+from apps.llms.serializers.llm import LLMResponseSchema
 
 
 # LLM list response serializer
@@ -16,7 +16,7 @@ class LLMListResponseSerializer(GenericResponseSerializer):
 
     Attributes:
         status_code (int): The status code of the response.
-        llms (List[LLMSerializer]): List of LLM objects with detailed information.
+        llms (List[LLMResponseSchema]): List of LLM objects with detailed information.
     """
 
     # Status code
@@ -27,7 +27,7 @@ class LLMListResponseSerializer(GenericResponseSerializer):
     )
 
     # LLM list
-    llms = LLMSerializer(
+    llms = LLMResponseSchema(
         many=True,
         read_only=True,
         help_text=_(
@@ -45,7 +45,7 @@ class LLMListMeResponseSerializer(GenericResponseSerializer):
 
     Attributes:
         status_code (int): The status code of the response.
-        llms (List[LLMSerializer]): List of LLM objects created by the current user.
+        llms (List[LLMResponseSchema]): List of LLM objects created by the current user.
     """
 
     # Status code
@@ -56,7 +56,7 @@ class LLMListMeResponseSerializer(GenericResponseSerializer):
     )
 
     # LLM list
-    llms = LLMSerializer(
+    llms = LLMResponseSchema(
         many=True,
         read_only=True,
         help_text=_(
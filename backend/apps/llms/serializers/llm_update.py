@@ -3,13 +3,20 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers, status
 
 # Local application imports
-from apps.common.serializers import GenericResponseSerializer
+from apps.common.serializers import CachedFieldsMixin, GenericResponseSerializer
 from apps.llms.models import LLM
 from apps.llms.serializers.llm import LLMResponseSchema
 
+# Fields that need cross-field validation when submitted
+LLM_UPDATE_VALIDATED_FIELDS = frozenset({"model", "api_key"})
+
+# Validation error payloads, copied and translated by ValidationError when raised
+LLM_UPDATE_MODEL_REQUIRED_ERROR = {"model": [_("Model name is required.")]}
+LLM_UPDATE_API_KEY_REQUIRED_ERROR = {"api_key": [_("API key is required.")]}
+
 
 # LLM update serializer
-class LLMUpdateSerializer(serializers.ModelSerializer):
+class LLMUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """LLM update serializer.
 
     This serializer handles updating existing LLM configurations. Only the LLM's creator
@@ -56,20 +63,6 @@ class LLMUpdateSerializer(serializers.ModelSerializer):
             "max_tokens": {"required": False},
         }
 
-    # Validate the base URL
-    def validate_base_url(self, value: str) -> str:
-        """Validate the base URL.
-
-        Args:
-            value (str): The base URL value.
-
-        Returns:
-            str: The validated base URL.
-        """
-
-        # Return the validated base URL
-        return value
-
     # Validate the model
     def validate(self, attrs: dict) -> dict:
         """Validate the data before updating.
@@ -88,27 +81,20 @@ class LLMUpdateSerializer(serializers.ModelSerializer):
             serializers.ValidationError: If validation fails.
         """
 
-        # Get the submitted values or use the current instance values
-        model = attrs.get("model", self.instance.model if self.instance else None)
-        api_key = attrs.get("api_key")
+        # Skip the checks when neither the model nor the API key is being updated
+        if not LLM_UPDATE_VALIDATED_FIELDS.intersection(attrs):
+            # Return the attributes unchanged
+            return attrs
 
-        # Validate model name if provided
-        if "model" in attrs and not model:
+        # Validate model name if provided (friendly error, the database enforces it too)
+        if "model" in attrs and not attrs["model"]:
             # Raise a validation error if model is empty
-            raise serializers.ValidationError(
-                {
-                    "model": [_("Model name is required.")],
-                },
-            )
+            raise serializers.ValidationError(LLM_UPDATE_MODEL_REQUIRED_ERROR)
 
         # If API key is not provided, check if there's an existing API key
-        if "api_key" in attrs and not api_key and not self.instance.get_api_key():
+        if "api_key" in attrs and not attrs["api_key"] and not self.instance.get_api_key():
             # Raise a validation error
-            raise serializers.ValidationError(
-                {
-                    "api_key": [_("API key is required.")],
-                },
-            )
+            raise serializers.ValidationError(LLM_UPDATE_API_KEY_REQUIRED_ERROR)
 
         # Return the validated attributes
         return attrs
@@ -140,6 +126,54 @@ class LLMUpdateSuccessResponseSerializer(GenericResponseSerializer):
     )
 
 
+# LLM update errors detail serializer
+class LLMUpdateErrorsDetailSerializer(serializers.Serializer):
+    """LLM Update Errors detail serializer.
+
+    Attributes:
+        base_url (list): Errors related to the base URL field.
+        model (list): Errors related to the model field.
+        api_key (list): Errors related to the API key field.
+        max_tokens (list): Errors related to the max tokens field.
+        non_field_errors (list): Non-field specific errors.
+    """
+
+    # Base URL field
+    base_url = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the base URL field."),
+    )
+
+    # Model field
+    model = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the model field."),
+    )
+
+    # API key field
+    api_key = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the API key field."),
+    )
+
+    # Max tokens field
+    max_tokens = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the max tokens field."),
+    )
+
+    # Non-field errors
+    non_field_errors = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Non-field specific errors."),
+    )
+
+
 # LLM update error response serializer
 class LLMUpdateErrorResponseSerializer(GenericResponseSerializer):
     """LLM update error response serializer (for schema).
@@ -159,53 +193,6 @@ class LLMUpdateErrorResponseSerializer(GenericResponseSerializer):
         help_text=_("HTTP status code for the response."),
     )
 
-    # Nested serializer defining the structure of the actual errors
-    class LLMUpdateErrorsDetailSerializer(serializers.Serializer):
-        """LLM Update Errors detail serializer.
-
-        Attributes:
-            base_url (list): Errors related to the base URL field.
-            model (list): Errors related to the model field.
-            api_key (list): Errors related to the API key field.
-            max_tokens (list): Errors related to the max tokens field.
-            non_field_errors (list): Non-field specific errors.
-        """
-
-        # Base URL field
-        base_url = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the base URL field."),
-        )
-
-        # Model field
-        model = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the model field."),
-        )
-
-        # API key field
-        api_key = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the API key field."),
-        )
-
-        # Max tokens field
-        max_tokens = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the max tokens field."),
-        )
-
-        # Non-field errors
-        non_field_errors = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Non-field specific errors."),
-        )
-
     # Define the 'errors' field containing the validation error details
     errors = LLMUpdateErrorsDetailSerializer(
         help_text=_("Object containing validation errors."),
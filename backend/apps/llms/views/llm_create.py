@@ -1,46 +1,42 @@
 # Third-party imports
-from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
 
 # Local application imports
 from apps.common.renderers import GenericJSONRenderer
+from apps.common.views import CustomExceptionMixin
 from apps.llms.serializers import (
-    LLMAuthErrorResponseSerializer,
+    LLM_AUTH_ERROR_RESPONSES,
     LLMCreateErrorResponseSerializer,
     LLMCreateSerializer,
     LLMCreateSuccessResponseSerializer,
     LLMSerializer,
 )
 
-# Get the User model
-User = get_user_model()
-
 
 # LLM creation view
-class LLMCreateView(APIView):
+class LLMCreateView(CustomExceptionMixin, APIView):
     """LLM creation view.
 
     This view allows authenticated users to create new LLM configurations within an organization.
     The user must be a member of the organization to create LLMs within it.
 
     Attributes:
-        renderer_classes (list): The renderer classes for the view.
-        permission_classes (list): The permission classes for the view.
+        renderer_classes (tuple): The renderer classes for the view.
+        permission_classes (tuple): The permission classes for the view.
         object_label (str): The object label for the response.
     """
 
     # Define the renderer classes
-    renderer_classes = [GenericJSONRenderer]
+    renderer_classes = (GenericJSONRenderer,)
 
     # Define the permission classes - require authentication
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
 
     # Define the object label
     object_label = "llm"
@@ -49,7 +45,11 @@ class LLMCreateView(APIView):
     def handle_exception(self, exc: Exception) -> Response:
         """Handle exceptions for the LLM creation view.
 
-        This method handles exceptions for the LLM creation view.
+        This method handles exceptions for the LLM creation view. Validation errors, the
+        most common failure, are checked first and answered directly in the errors envelope
+        documented by LLMCreateErrorResponseSerializer. They are not passed to DRF's own
+        handler, whose body would be the bare field errors. Every other exception goes to
+        the shared handler, which resolves its status with one lookup per base class.
 
         Args:
             exc (Exception): The exception that occurred.
@@ -58,19 +58,16 @@ class LLMCreateView(APIView):
             Response: The HTTP response object.
         """
 
-        # Return custom format for authentication errors
-        if isinstance(exc, (AuthenticationFailed, TokenError)):
-            # Return the error response
+        # Wrap validation errors in the errors envelope
+        if isinstance(exc, ValidationError):
+            # Return the validation error response
             return Response(
-                {"error": str(exc)},
-                status=status.HTTP_401_UNAUTHORIZED,
+                {"errors": exc.detail},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Return the exception as a standard error
-        return Response(
-            {"error": str(exc)},
-            status=getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        )
+        # Fall back to the shared error response
+        return super().handle_exception(exc)
 
     # Define the schema for the POST view
     @extend_schema(
@@ -85,7 +82,7 @@ class LLMCreateView(APIView):
         responses={
             status.HTTP_201_CREATED: LLMCreateSuccessResponseSerializer,
             status.HTTP_400_BAD_REQUEST: LLMCreateErrorResponseSerializer,
-            status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+            **LLM_AUTH_ERROR_RESPONSES,
         },
     )
     def post(self, request: Request) -> Response:
@@ -99,6 +96,9 @@ class LLMCreateView(APIView):
 
         Returns:
             Response: The HTTP response object.
+
+        Raises:
+            ValidationError: If the submitted data is invalid.
         """
 
         # Create a new LLM instance
@@ -107,22 +107,17 @@ class LLMCreateView(APIView):
             context={"request": request},
         )
 
-        # Validate the serializer
-        if serializer.is_valid():
-            # Save the LLM instance
-            llm = serializer.save()
+        # Validate the serializer, raising the errors for handle_exception to wrap
+        serializer.is_valid(raise_exception=True)
 
-            # Serialize the created LLM for the response body
-            response_serializer = LLMSerializer(llm)
+        # Save the LLM instance
+        llm = serializer.save()
 
-            # Return a successful response with the serialized LLM data
-            return Response(
-                response_serializer.data,
-                status=status.HTTP_201_CREATED,
-            )
+        # Serialize the created LLM for the response body
+        response_serializer = LLMSerializer(llm)
 
-        # Return an error response with validation errors
+        # Return a successful response with the serialized LLM data
         return Response(
-            {"errors": serializer.errors},
-            status=status.HTTP_400_BAD_REQUEST,
+            response_serializer.data,
+            status=status.HTTP_201_CREATED,
         )
@@ -1,31 +1,29 @@
 # Third-party imports
-from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.exceptions import AuthenticationFailed, NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
 
 # Local application imports
+from apps.agents.models import Agent
 from apps.common.renderers import GenericJSONRenderer
+from apps.common.utils import is_valid_uuid
+from apps.common.views import CustomExceptionMixin
 from apps.llms.models import LLM
 from apps.llms.serializers import (
-    LLMAuthErrorResponseSerializer,
+    LLM_AUTH_ERROR_RESPONSES,
     LLMDeleteNotFoundResponseSerializer,
     LLMDeletePermissionDeniedResponseSerializer,
     LLMDeleteSuccessResponseSerializer,
     LLMHasAgentsResponseSerializer,
 )
 
-# Get the User model
-User = get_user_model()
-
 
 # LLM delete view
-class LLMDeleteView(APIView):
+class LLMDeleteView(CustomExceptionMixin, APIView):
     """LLM delete view.
 
     This view allows users to delete their own LLM configurations.
@@ -33,63 +31,20 @@ class LLMDeleteView(APIView):
     An LLM cannot be deleted if it is associated with any agents.
 
     Attributes:
-        renderer_classes (list): The renderer classes for the view.
-        permission_classes (list): The permission classes for the view.
+        renderer_classes (tuple): The renderer classes for the view.
+        permission_classes (tuple): The permission classes for the view.
         object_label (str): The object label for the response.
     """
 
     # Define the renderer classes
-    renderer_classes = [GenericJSONRenderer]
+    renderer_classes = (GenericJSONRenderer,)
 
     # Define the permission classes - require authentication
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
 
     # Define the object label
     object_label = "llm"
 
-    # Override the handle_exception method to customize error responses
-    def handle_exception(self, exc: Exception) -> Response:
-        """Handle exceptions for the LLM delete view.
-
-        This method handles exceptions for the LLM delete view.
-
-        Args:
-            exc (Exception): The exception that occurred.
-
-        Returns:
-            Response: The HTTP response object.
-        """
-
-        # Return custom format for authentication errors
-        if isinstance(exc, (AuthenticationFailed, TokenError)):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        # Return custom format for permission errors
-        if isinstance(exc, PermissionDenied):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        # Return custom format for not found errors
-        if isinstance(exc, NotFound):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Return the exception as a standard error
-        return Response(
-            {"error": str(exc)},
-            status=getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        )
-
     # Define the schema
     @extend_schema(
         tags=["LLMs"],
@@ -101,7 +56,7 @@ class LLMDeleteView(APIView):
         responses={
             status.HTTP_200_OK: LLMDeleteSuccessResponseSerializer,
             status.HTTP_400_BAD_REQUEST: LLMHasAgentsResponseSerializer,
-            status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+            **LLM_AUTH_ERROR_RESPONSES,
             status.HTTP_403_FORBIDDEN: LLMDeletePermissionDeniedResponseSerializer,
             status.HTTP_404_NOT_FOUND: LLMDeleteNotFoundResponseSerializer,
         },
@@ -127,40 +82,50 @@ class LLMDeleteView(APIView):
         # Get the authenticated user
         user = request.user
 
+        # Check if the LLM ID is a valid UUID
+        if not is_valid_uuid(llm_id):
+            # Return 404 Not Found without querying for a malformed ID
+            return Response(
+                {"error": "LLM not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
         try:
-            # Try to get the LLM
-            llm = LLM.objects.get(id=llm_id)
+            # Try to get the user's LLM, flagging whether any agent uses it in the same query
+            llm = LLM.objects.annotate(
+                has_agents=Exists(Agent.objects.filter(llm_id=OuterRef("pk"))),
+            ).get(id=llm_id, user_id=user.id)
 
-            # Check if the user is the creator of the LLM
-            if llm.user != user:
+        except LLM.DoesNotExist:
+            # Check if the LLM exists but belongs to another user
+            if LLM.objects.filter(id=llm_id).exists():
                 # Return the error response
                 return Response(
                     {"error": "You do not have permission to delete this LLM."},
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
-            # Check if the LLM is associated with any agents
-            if llm.agents.exists():
-                # Return the error response
-                return Response(
-                    {
-                        "error": "Cannot delete LLM because it is associated with one or more agents.",
-                    },
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Delete the LLM
-            llm.delete()
-
-            # Return 200 OK with success message
-            return Response(
-                {"message": "LLM deleted successfully."},
-                status=status.HTTP_200_OK,
-            )
-
-        except LLM.DoesNotExist:
             # If the LLM doesn't exist, return a 404 error
             return Response(
                 {"error": "LLM not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
+
+        # Check if the LLM is associated with any agents
+        if llm.has_agents:
+            # Return the error response
+            return Response(
+                {
+                    "error": "Cannot delete LLM because it is associated with one or more agents.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Delete the LLM
+        llm.delete()
+
+        # Return 200 OK with success message
+        return Response(
+            {"message": "LLM deleted successfully."},
+            status=status.HTTP_200_OK,
+        )
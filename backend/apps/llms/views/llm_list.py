@@ -1,23 +1,28 @@
 # Third-party imports
 from django.contrib.auth import get_user_model
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
 
 # Local application imports
+from apps.common.pagination import OPTIONAL_CURSOR_PAGINATION_PARAMETERS, OptionalCursorPagination
 from apps.common.renderers import GenericJSONRenderer
+from apps.common.utils import is_valid_uuid
+from apps.common.views import CustomExceptionMixin
 from apps.llms.models import LLM
 from apps.llms.serializers import (
+    LLM_AUTH_ERROR_RESPONSES,
+    LLM_LIST_VALUES_FIELDS,
     LLMAuthErrorResponseSerializer,
     LLMListMissingParamResponseSerializer,
     LLMListNotFoundResponseSerializer,
     LLMListResponseSerializer,
-    LLMSerializer,
+    serialize_llm_list,
+    serialize_llm_rows,
 )
 from apps.organization.models import Organization
 
@@ -26,7 +31,7 @@ User = get_user_model()
 
 
 # LLM list view
-class LLMListView(APIView):
+class LLMListView(CustomExceptionMixin, APIView):
     """LLM list view.
 
     This view allows organization owners to list LLM configurations within their organization.
@@ -34,46 +39,23 @@ class LLMListView(APIView):
     view LLMs created by other members of the organization.
 
     Attributes:
-        renderer_classes (list): The renderer classes for the view.
-        permission_classes (list): The permission classes for the view.
+        renderer_classes (tuple): The renderer classes for the view.
+        permission_classes (tuple): The permission classes for the view.
         object_label (str): The object label for the response.
+        pagination_class (type): The paginator used when a page size is requested.
     """
 
     # Define the renderer classes
-    renderer_classes = [GenericJSONRenderer]
+    renderer_classes = (GenericJSONRenderer,)
 
     # Define the permission classes - require authentication
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
 
     # Define the object label
     object_label = "llms"
 
-    # Override the handle_exception method to customize error responses
-    def handle_exception(self, exc: Exception) -> Response:
-        """Handle exceptions for the LLM list view.
-
-        This method handles exceptions for the LLM list view.
-
-        Args:
-            exc (Exception): The exception that occurred.
-
-        Returns:
-            Response: The HTTP response object.
-        """
-
-        # Return custom format for authentication errors
-        if isinstance(exc, (AuthenticationFailed, TokenError)):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        # Return the exception as a standard error
-        return Response(
-            {"error": str(exc)},
-            status=getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        )
+    # Define the paginator, only applied when the client sends a page size
+    pagination_class = OptionalCursorPagination
 
     # Define the schema for the list view
     @extend_schema(
@@ -83,6 +65,8 @@ class LLMListView(APIView):
         Lists LLM configurations within the specified organization for a specific user.
         Only the organization owner can view LLMs created by other members.
         Both organization_id and username parameters are mandatory.
+        Pass page_size to receive the results newest first as a cursor-paginated
+        object with next, previous and results keys.
         """,
         parameters=[
             OpenApiParameter(
@@ -97,16 +81,17 @@ class LLMListView(APIView):
                 required=True,
                 type=str,
             ),
+            *OPTIONAL_CURSOR_PAGINATION_PARAMETERS,
         ],
         responses={
             status.HTTP_200_OK: LLMListResponseSerializer,
             status.HTTP_400_BAD_REQUEST: LLMListMissingParamResponseSerializer,
-            status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+            **LLM_AUTH_ERROR_RESPONSES,
             status.HTTP_403_FORBIDDEN: LLMAuthErrorResponseSerializer,
             status.HTTP_404_NOT_FOUND: LLMListNotFoundResponseSerializer,
         },
     )
-    def get(self, request: Request) -> Response:  # noqa: PLR0911
+    def get(self, request: Request) -> Response:
         """List LLM configurations within an organization by username.
 
         This method lists LLM configurations within the specified organization for a specific user.
@@ -120,11 +105,64 @@ class LLMListView(APIView):
             Response: The HTTP response object with the list of LLM configurations.
         """
 
-        # Get the authenticated user
-        user = request.user
+        # Get the organization ID and username from the query parameters
+        organization_id = request.query_params.get("organization_id")
+        username = request.query_params.get("username")
+
+        # Check the query parameters, then the user's access to the requested LLMs
+        error_response = self.get_query_params_error(organization_id, username) or self.get_access_error(
+            request.user,
+            organization_id,
+            username,
+        )
+
+        # Return the error response if the request can't be served
+        if error_response is not None:
+            # Return the error response
+            return error_response
+
+        # Get LLMs created by the specified user in the organization
+        queryset = LLM.objects.filter(organization_id=organization_id, user__username=username)
+
+        # Paginate the flat rows if the client asked for a page size
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset.values(*LLM_LIST_VALUES_FIELDS), request, view=self)
+
+        # Serialize the page, or the whole list in a single query if pagination wasn't requested
+        llms = serialize_llm_list(queryset) if page is None else serialize_llm_rows(page)
+
+        # Check if any LLM configurations were found
+        if not llms:
+            # Return 404 Not Found if no LLMs match the criteria
+            return Response(
+                {"error": "No LLM configurations found matching the criteria."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Return the page with its cursor links if pagination was requested
+        if page is not None:
+            # Return the paginated response
+            return paginator.get_paginated_response(llms)
+
+        # Return the serialized LLM configurations directly
+        return Response(
+            llms,
+            status=status.HTTP_200_OK,
+        )
+
+    # Check the query parameters of the list request
+    def get_query_params_error(self, organization_id: str | None, username: str | None) -> Response | None:
+        """Check the query parameters of the list request.
+
+        Args:
+            organization_id (str | None): The organization_id query parameter.
+            username (str | None): The username query parameter.
+
+        Returns:
+            Response | None: The error response, or None if the parameters are valid.
+        """
 
         # Check if organization_id is provided
-        organization_id = request.query_params.get("organization_id")
         if not organization_id:
             # Return 400 Bad Request if organization_id is not provided
             return Response(
@@ -133,7 +171,6 @@ class LLMListView(APIView):
             )
 
         # Check if username is provided
-        username = request.query_params.get("username")
         if not username:
             # Return 400 Bad Request if username is not provided
             return Response(
@@ -141,11 +178,53 @@ class LLMListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        try:
-            # Get the organization
-            organization = Organization.objects.get(id=organization_id)
+        # Check if the organization ID is a valid UUID
+        if not is_valid_uuid(organization_id):
+            # Return 404 Not Found without querying for a malformed ID
+            return Response(
+                {"error": "Organization not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        # Return None if the parameters are valid
+        return None
+
+    # Check whether the user can list the target user's LLMs in the organization
+    def get_access_error(self, user: User, organization_id: str, username: str) -> Response | None:
+        """Check whether the user can list the target user's LLMs in the organization.
+
+        The organization, both memberships and the target user are fetched in a single query.
+
+        Args:
+            user (User): The authenticated user.
+            organization_id (str): The ID of the organization.
+            username (str): The username of the user whose LLMs are listed.
 
-        except Organization.DoesNotExist:
+        Returns:
+            Response | None: The error response, or None if the user has access.
+        """
+
+        # Get the organization membership link model
+        membership = Organization.members.through
+
+        # Fetch the organization together with every membership and existence check in one query
+        organization = (
+            Organization.objects.filter(id=organization_id)
+            .annotate(
+                user_is_member=Exists(
+                    membership.objects.filter(organization_id=OuterRef("pk"), user_id=user.id),
+                ),
+                target_exists=Exists(User.objects.filter(username=username)),
+                target_is_member=Exists(
+                    membership.objects.filter(organization_id=OuterRef("pk"), user__username=username),
+                ),
+            )
+            .values("owner_id", "user_is_member", "target_exists", "target_is_member")
+            .first()
+        )
+
+        # Check if the organization exists
+        if organization is None:
             # Return 404 Not Found if the organization doesn't exist
             return Response(
                 {"error": "Organization not found."},
@@ -153,58 +232,36 @@ class LLMListView(APIView):
             )
 
         # Check if the user is a member of the specified organization
-        if not user.organizations.filter(id=organization_id).exists():
+        if not organization["user_is_member"]:
             # Return 404 Not Found if the user is not a member of the organization
             return Response(
                 {"error": "No LLM configurations found matching the criteria."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        try:
-            # Check if the target user exists
-            target_user = User.objects.get(username=username)
-
-            # Check if the user is trying to view LLMs created by another user
-            if user.username != username:
-                # Only the organization owner can view LLMs created by other members
-                if organization.owner != user:
-                    # Return 403 Forbidden if the user is not the organization owner
-                    return Response(
-                        {"error": "Only the organization owner can view LLMs created by other members."},
-                        status=status.HTTP_403_FORBIDDEN,
-                    )
-
-            # Check if the target user is a member of the organization
-            if not organization.members.filter(id=target_user.id).exists():
-                # Return 404 Not Found if the target user is not a member of the organization
-                return Response(
-                    {"error": "The specified user is not a member of this organization."},
-                    status=status.HTTP_404_NOT_FOUND,
-                )
-
-        except User.DoesNotExist:
+        # Check if the target user exists
+        if not organization["target_exists"]:
             # Return 404 Not Found if the user doesn't exist
             return Response(
                 {"error": "User not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Get LLMs created by the specified user in the organization
-        queryset = LLM.objects.filter(organization_id=organization_id, user=target_user)
+        # Only the organization owner can view LLMs created by other members
+        if user.username != username and organization["owner_id"] != user.id:
+            # Return 403 Forbidden if the user is not the organization owner
+            return Response(
+                {"error": "Only the organization owner can view LLMs created by other members."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
 
-        # Check if any LLM configurations were found
-        if not queryset.exists():
-            # Return 404 Not Found if no LLMs match the criteria
+        # Check if the target user is a member of the organization
+        if not organization["target_is_member"]:
+            # Return 404 Not Found if the target user is not a member of the organization
             return Response(
-                {"error": "No LLM configurations found matching the criteria."},
+                {"error": "The specified user is not a member of this organization."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Serialize the LLM configurations
-        serializer = LLMSerializer(queryset, many=True)
-
-        # Return the serialized LLM configurations directly
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK,
-        )
+        # Return None if the user has access
+        return None
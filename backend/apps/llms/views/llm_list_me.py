@@ -1,78 +1,113 @@
 # Third-party imports
-from django.contrib.auth import get_user_model
+from django.db.models import Count, Max
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
 
 # Local application imports
+from apps.common.pagination import OPTIONAL_CURSOR_PAGINATION_PARAMETERS, OptionalCursorPagination
 from apps.common.renderers import GenericJSONRenderer
+from apps.common.utils import is_valid_uuid
+from apps.common.views import CustomExceptionMixin
 from apps.llms.models import LLM
 from apps.llms.serializers import (
-    LLMAuthErrorResponseSerializer,
+    LLM_AUTH_ERROR_RESPONSES,
+    LLM_LIST_VALUES_FIELDS,
     LLMListMeResponseSerializer,
     LLMListMissingParamResponseSerializer,
     LLMListNotFoundResponseSerializer,
-    LLMSerializer,
+    serialize_llm_list,
+    serialize_llm_rows,
 )
 
-# Get the User model
-User = get_user_model()
+
+# Compute the ETag for the current user's LLM list in an organization
+def llm_list_me_etag(request: Request, *args, **kwargs) -> str | None:
+    """Compute the ETag for the current user's LLM list in an organization.
+
+    The tag changes whenever one of the listed LLMs is created, updated or deleted, or
+    when the organization or user embedded in each entry changes. No tag is returned
+    when the request would not produce a list, so errors are never answered with a 304.
+
+    Args:
+        request (Request): The HTTP request object.
+        *args: Variable length argument list.
+        **kwargs: Arbitrary keyword arguments.
+
+    Returns:
+        str | None: The ETag value, or None if there is no list to tag.
+    """
+
+    # Get the organization ID from the query parameters
+    organization_id = request.query_params.get("organization_id")
+
+    # Leave missing or malformed organization IDs to the view
+    if not is_valid_uuid(organization_id):
+        # Return no ETag
+        return None
+
+    # Summarize the user's LLMs in the organization, only if the user is still a member
+    summary = LLM.objects.filter(
+        user_id=request.user.id,
+        organization_id=organization_id,
+        organization__members=request.user.id,
+    ).aggregate(
+        count=Count("id"),
+        llms_updated_at=Max("updated_at"),
+        organization_updated_at=Max("organization__updated_at"),
+    )
+
+    # Return no ETag if there is nothing to list
+    if not summary["count"]:
+        # Return no ETag
+        return None
+
+    # Return the ETag built from the list size, the latest modification times and the requested page
+    return "-".join(
+        [
+            str(summary["count"]),
+            str(summary["llms_updated_at"].timestamp()),
+            str(summary["organization_updated_at"].timestamp()),
+            str(request.user.updated_at.timestamp()),
+            request.query_params.get("page_size", ""),
+            request.query_params.get("cursor", ""),
+        ],
+    )
 
 
 # LLM list me view
-class LLMListMeView(APIView):
+class LLMListMeView(CustomExceptionMixin, APIView):
     """LLM list me view.
 
     This view allows authenticated users to list all LLM configurations they have created.
     It requires the organization_id parameter.
 
     Attributes:
-        renderer_classes (list): The renderer classes for the view.
-        permission_classes (list): The permission classes for the view.
+        renderer_classes (tuple): The renderer classes for the view.
+        permission_classes (tuple): The permission classes for the view.
         object_label (str): The object label for the response.
+        pagination_class (type): The paginator used when a page size is requested.
     """
 
     # Define the renderer classes
-    renderer_classes = [GenericJSONRenderer]
+    renderer_classes = (GenericJSONRenderer,)
 
     # Define the permission classes - require authentication
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
 
     # Define the object label
     object_label = "llms"
 
-    # Override the handle_exception method to customize error responses
-    def handle_exception(self, exc: Exception) -> Response:
-        """Handle exceptions for the LLM list me view.
-
-        This method handles exceptions for the LLM list me view.
-
-        Args:
-            exc (Exception): The exception that occurred.
-
-        Returns:
-            Response: The HTTP response object.
-        """
-
-        # Return custom format for authentication errors
-        if isinstance(exc, (AuthenticationFailed, TokenError)):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        # Return the exception as a standard error
-        return Response(
-            {"error": str(exc)},
-            status=getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        )
+    # Define the paginator, only applied when the client sends a page size
+    pagination_class = OptionalCursorPagination
 
+    # Answer conditional requests with 304 Not Modified when the list is unchanged
+    @method_decorator(condition(etag_func=llm_list_me_etag))
     # Define the schema for the list me view
     @extend_schema(
         tags=["LLMs"],
@@ -80,6 +115,8 @@ class LLMListMeView(APIView):
         description="""
         Lists all LLM configurations created by the authenticated user.
         Requires organization_id parameter.
+        Pass page_size to receive the results newest first as a cursor-paginated
+        object with next, previous and results keys.
         """,
         parameters=[
             OpenApiParameter(
@@ -88,11 +125,12 @@ class LLMListMeView(APIView):
                 required=True,
                 type=str,
             ),
+            *OPTIONAL_CURSOR_PAGINATION_PARAMETERS,
         ],
         responses={
             status.HTTP_200_OK: LLMListMeResponseSerializer,
             status.HTTP_400_BAD_REQUEST: LLMListMissingParamResponseSerializer,
-            status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+            **LLM_AUTH_ERROR_RESPONSES,
             status.HTTP_404_NOT_FOUND: LLMListNotFoundResponseSerializer,
         },
     )
@@ -121,33 +159,43 @@ class LLMListMeView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Get the user's organizations
-        user_organizations = user.organizations.all()
-
-        # Check if the user is a member of the specified organization
-        if not user_organizations.filter(id=organization_id).exists():
-            # Return 404 Not Found if the user is not a member of the organization
+        # Check if the organization ID is a valid UUID
+        if not is_valid_uuid(organization_id):
+            # Return 404 Not Found without querying for a malformed ID
             return Response(
                 {"error": "No LLM configurations found matching the criteria."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Build query for user's LLMs in the specified organization
-        queryset = LLM.objects.filter(user=user, organization_id=organization_id)
+        # Build query for user's LLMs in the specified organization, only while the user is a member
+        queryset = LLM.objects.filter(
+            user_id=user.id,
+            organization_id=organization_id,
+            organization__members=user.id,
+        )
+
+        # Paginate the flat rows if the client asked for a page size
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset.values(*LLM_LIST_VALUES_FIELDS), request, view=self)
+
+        # Serialize the page, or the whole list in a single query if pagination wasn't requested
+        llms = serialize_llm_list(queryset) if page is None else serialize_llm_rows(page)
 
-        # Check if any LLM configurations were found
-        if not queryset.exists():
+        # Check if any LLM configurations were found, which also covers non-members
+        if not llms:
             # Return 404 Not Found if no LLMs match the criteria
             return Response(
                 {"error": "No LLM configurations found matching the criteria."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Serialize the LLM configurations
-        serializer = LLMSerializer(queryset, many=True)
+        # Return the page with its cursor links if pagination was requested
+        if page is not None:
+            # Return the paginated response
+            return paginator.get_paginated_response(llms)
 
         # Return the serialized LLM configurations directly
         return Response(
-            serializer.data,
+            llms,
             status=status.HTTP_200_OK,
         )
@@ -1,19 +1,18 @@
 # Third-party imports
-from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
-from rest_framework.exceptions import AuthenticationFailed, NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.exceptions import TokenError
 
 # Local application imports
 from apps.common.renderers import GenericJSONRenderer
+from apps.common.utils import is_valid_uuid
+from apps.common.views import CustomExceptionMixin
 from apps.llms.models import LLM
 from apps.llms.serializers import (
-    LLMAuthErrorResponseSerializer,
+    LLM_AUTH_ERROR_RESPONSES,
     LLMNotFoundResponseSerializer,
     LLMPermissionDeniedResponseSerializer,
     LLMSerializer,
@@ -22,75 +21,29 @@ from apps.llms.serializers import (
     LLMUpdateSuccessResponseSerializer,
 )
 
-# Get the User model
-User = get_user_model()
-
 
 # LLM update view
-class LLMUpdateView(APIView):
+class LLMUpdateView(CustomExceptionMixin, APIView):
     """LLM update view.
 
     This view allows users to update their own LLM configurations.
     Only the user who created an LLM can update it.
 
     Attributes:
-        renderer_classes (list): The renderer classes for the view.
-        permission_classes (list): The permission classes for the view.
+        renderer_classes (tuple): The renderer classes for the view.
+        permission_classes (tuple): The permission classes for the view.
         object_label (str): The object label for the response.
     """
 
     # Define the renderer classes
-    renderer_classes = [GenericJSONRenderer]
+    renderer_classes = (GenericJSONRenderer,)
 
     # Define the permission classes - require authentication
-    permission_classes = [IsAuthenticated]
+    permission_classes = (IsAuthenticated,)
 
     # Define the object label
     object_label = "llm"
 
-    # Override the handle_exception method to customize error responses
-    def handle_exception(self, exc: Exception) -> Response:
-        """Handle exceptions for the LLM update view.
-
-        This method handles exceptions for the LLM update view.
-
-        Args:
-            exc (Exception): The exception that occurred.
-
-        Returns:
-            Response: The HTTP response object.
-        """
-
-        # Return custom format for authentication errors
-        if isinstance(exc, (AuthenticationFailed, TokenError)):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        # Return custom format for permission errors
-        if isinstance(exc, PermissionDenied):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        # Return custom format for not found errors
-        if isinstance(exc, NotFound):
-            # Return the error response
-            return Response(
-                {"error": str(exc)},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Return the exception as a standard error
-        return Response(
-            {"error": str(exc)},
-            status=getattr(exc, "status_code", status.HTTP_500_INTERNAL_SERVER_ERROR),
-        )
-
     # Define the schema
     @extend_schema(
         tags=["LLMs"],
@@ -103,7 +56,7 @@ class LLMUpdateView(APIView):
         responses={
             status.HTTP_200_OK: LLMUpdateSuccessResponseSerializer,
             status.HTTP_400_BAD_REQUEST: LLMUpdateErrorResponseSerializer,
-            status.HTTP_401_UNAUTHORIZED: LLMAuthErrorResponseSerializer,
+            **LLM_AUTH_ERROR_RESPONSES,
             status.HTTP_403_FORBIDDEN: LLMPermissionDeniedResponseSerializer,
             status.HTTP_404_NOT_FOUND: LLMNotFoundResponseSerializer,
         },
@@ -128,12 +81,21 @@ class LLMUpdateView(APIView):
         # Get the authenticated user
         user = request.user
 
+        # Check if the LLM ID is a valid UUID
+        if not is_valid_uuid(llm_id):
+            # Return 404 Not Found without querying for a malformed ID
+            return Response(
+                {"error": "LLM configuration not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
         try:
-            # Try to get the LLM
-            llm = LLM.objects.get(id=llm_id)
+            # Try to get the user's LLM with the organization and user rendered in the response
+            llm = LLM.objects.select_related("organization", "user").get(id=llm_id, user_id=user.id)
 
-            # Check if the user is the creator of the LLM
-            if llm.user != user:
+        except LLM.DoesNotExist:
+            # Check if the LLM exists but belongs to another user
+            if LLM.objects.filter(id=llm_id).exists():
                 # Return the error response
                 return Response(
                     {
@@ -142,32 +104,31 @@ class LLMUpdateView(APIView):
                     status=status.HTTP_403_FORBIDDEN,
                 )
 
-            # Create serializer with the LLM and data
-            serializer = LLMUpdateSerializer(llm, data=request.data, partial=True)
+            # If the LLM doesn't exist, return a 404 error
+            return Response(
+                {"error": "LLM configuration not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-            # Validate the serializer
-            if serializer.is_valid():
-                # Save the updated LLM
-                updated_llm = serializer.save()
+        # Create serializer with the LLM and data
+        serializer = LLMUpdateSerializer(llm, data=request.data, partial=True)
 
-                # Serialize the updated LLM for response
-                response_serializer = LLMSerializer(updated_llm)
+        # Validate the serializer
+        if serializer.is_valid():
+            # Save the updated LLM
+            updated_llm = serializer.save()
 
-                # Return 200 OK with the updated LLM data
-                return Response(
-                    response_serializer.data,
-                    status=status.HTTP_200_OK,
-                )
+            # Serialize the updated LLM for response
+            response_serializer = LLMSerializer(updated_llm)
 
-            # Return 400 Bad Request with validation errors
+            # Return 200 OK with the updated LLM data
             return Response(
-                {"errors": serializer.errors},
-                status=status.HTTP_400_BAD_REQUEST,
+                response_serializer.data,
+                status=status.HTTP_200_OK,
             )
 
-        except LLM.DoesNotExist:
-            # If the LLM doesn't exist, return a 404 error
-            return Response(
-                {"error": "LLM configuration not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        # Return 400 Bad Request with validation errors
+        return Response(
+            {"errors": serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -1,5 +1,7 @@
 # Third-party imports
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
@@ -17,6 +19,7 @@ class OrganizationAdmin(admin.ModelAdmin):
     Attributes:
         list_display (list): Fields to display in the admin list view.
         list_display_links (list): Fields that link to the detail view.
+        list_select_related (list): Related fields to join in the list view.
         search_fields (list): Fields to search in the admin interface.
         list_filter (list): Fields to filter by in the admin interface.
         readonly_fields (list): Fields that cannot be modified.
@@ -37,6 +40,9 @@ class OrganizationAdmin(admin.ModelAdmin):
     # Fields that link to the detail view
     list_display_links = ["id", "name"]
 
+    # Related fields to join in the list view
+    list_select_related = ["owner"]
+
     # Fields to search in the admin interface
     search_fields = ["name", "owner__email", "owner__username"]
 
@@ -68,6 +74,22 @@ class OrganizationAdmin(admin.ModelAdmin):
         ),
     )
 
+    # Get the admin queryset with the member count annotated
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Get the admin queryset with the member count annotated.
+
+        Counting members in the query avoids a COUNT query for every row of the list view.
+
+        Args:
+            request (HttpRequest): The HTTP request object.
+
+        Returns:
+            QuerySet: The organizations annotated with annotated_member_count.
+        """
+
+        # Annotate each organization with its number of members
+        return super().get_queryset(request).with_member_count()
+
     # Get the number of members in the organization
     def member_count(self, obj: Organization) -> int:
         """Get the number of members in the organization.
@@ -79,12 +101,15 @@ class OrganizationAdmin(admin.ModelAdmin):
             int: The count of members in the organization.
         """
 
-        # Return the number of members
-        return obj.members.count()
+        # Return the annotated number of members
+        return obj.annotated_member_count
 
     # Set the column name for the member_count field
     member_count.short_description = _("Member Count")
 
+    # Sort the member_count column by the annotated count
+    member_count.admin_order_field = "annotated_member_count"
+
     # Display the organization logo in the admin interface
     def display_logo(self, obj: Organization) -> str:
         """Display the organization logo in the admin interface.
@@ -12,6 +12,7 @@ class OrganizationOwnershipTransferAdmin(admin.ModelAdmin):
 
     Attributes:
         list_display (tuple): Fields to display in the list view.
+        list_select_related (tuple): Related fields to join in the list view.
         list_filter (tuple): Fields to filter the list view by.
         search_fields (tuple): Fields to search in.
         readonly_fields (tuple): Fields that cannot be edited.
@@ -25,20 +26,21 @@ class OrganizationOwnershipTransferAdmin(admin.ModelAdmin):
         "new_owner",
         "expiration_time",
         "is_active",
-        "is_accepted",
-        "is_rejected",
-        "is_expired",
-        "is_cancelled",
+        "status",
         "created_at",
         "updated_at",
     )
 
+    # Related fields to join in the list view
+    list_select_related = (
+        "organization",
+        "current_owner",
+        "new_owner",
+    )
+
     # Fields to filter the list view by
     list_filter = (
-        "is_accepted",
-        "is_rejected",
-        "is_expired",
-        "is_cancelled",
+        "status",
         "created_at",
         "updated_at",
     )
@@ -0,0 +1,14 @@
+# Local application imports
+from apps.organization.managers.organization_manager import OrganizationManager, OrganizationQuerySet
+from apps.organization.managers.ownership_transfer_manager import (
+    OrganizationOwnershipTransferManager,
+    OrganizationOwnershipTransferQuerySet,
+)
+
+# Exports
+__all__ = [
+    "OrganizationManager",
+    "OrganizationOwnershipTransferManager",
+    "OrganizationOwnershipTransferQuerySet",
+    "OrganizationQuerySet",
+]
@@ -0,0 +1,56 @@
+# Third-party imports
+from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# Custom organization queryset
+class OrganizationQuerySet(models.QuerySet):
+    """Custom queryset for the Organization model.
+
+    Provides annotations used when several organizations are serialized at once.
+    """
+
+    # Annotate each organization with its number of members
+    def with_member_count(self) -> "OrganizationQuerySet":
+        """Annotate each organization with its number of members.
+
+        The count is computed in a correlated subquery rather than through a JOIN, so it
+        stays correct when the queryset is already filtered on the members relation.
+        Organization.member_count returns the annotation when it is present.
+
+        Returns:
+            OrganizationQuerySet: The organizations annotated with annotated_member_count.
+        """
+
+        # Count the membership rows of the outer organization
+        member_count = (
+            self.model.members.through.objects.filter(organization_id=OuterRef("pk"))
+            .values("organization_id")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+
+        # Annotate the count, using zero for organizations without members
+        return self.annotate(annotated_member_count=Coalesce(Subquery(member_count), 0))
+
+
+# Custom organization manager
+class OrganizationManager(models.Manager.from_queryset(OrganizationQuerySet)):
+    """Custom manager for the Organization model.
+
+    Every organization response embeds its owner, so the owner is joined into the
+    default queryset. Listing organizations then costs a single query instead of
+    one extra user lookup per organization.
+    """
+
+    # Get the default queryset for organizations
+    def get_queryset(self) -> OrganizationQuerySet:
+        """Get the default queryset for organizations.
+
+        Returns:
+            OrganizationQuerySet: The organizations with their owner joined in.
+        """
+
+        # Join the owner into every organization query
+        return super().get_queryset().select_related("owner")
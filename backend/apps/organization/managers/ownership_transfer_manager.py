@@ -0,0 +1,31 @@
+# Third-party imports
+from django.db import models
+
+
+# Custom organization ownership transfer queryset
+class OrganizationOwnershipTransferQuerySet(models.QuerySet):
+    """Custom queryset for the OrganizationOwnershipTransfer model.
+
+    Provides the joins needed when several transfers are serialized at once.
+    """
+
+    # Join the relations embedded in every transfer response
+    def with_related(self) -> "OrganizationOwnershipTransferQuerySet":
+        """Join the organization, current owner and new owner of each transfer.
+
+        Transfer responses embed the organization name and both owners, so without these
+        joins every listed transfer would cost three extra queries.
+
+        Returns:
+            OrganizationOwnershipTransferQuerySet: The transfers with their relations joined in.
+        """
+
+        # Join the organization and both owners
+        return self.select_related("organization", "current_owner", "new_owner")
+
+
+# Custom organization ownership transfer manager
+OrganizationOwnershipTransferManager = models.Manager.from_queryset(
+    OrganizationOwnershipTransferQuerySet,
+    "OrganizationOwnershipTransferManager",
+)
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.13 on 2026-10-18 09:30
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def flags_to_status(apps, schema_editor):
+    OrganizationOwnershipTransfer = apps.get_model('organization', 'OrganizationOwnershipTransfer')
+    transfers = OrganizationOwnershipTransfer.objects.all()
+    transfers.filter(is_expired=True).update(status=4)
+    transfers.filter(is_cancelled=True).update(status=3)
+    transfers.filter(is_rejected=True).update(status=2)
+    transfers.filter(is_accepted=True).update(status=1)
+
+
+def status_to_flags(apps, schema_editor):
+    OrganizationOwnershipTransfer = apps.get_model('organization', 'OrganizationOwnershipTransfer')
+    transfers = OrganizationOwnershipTransfer.objects.all()
+    transfers.filter(status=1).update(is_accepted=True)
+    transfers.filter(status=2).update(is_rejected=True)
+    transfers.filter(status=3).update(is_cancelled=True)
+    transfers.filter(status=4).update(is_expired=True)
+
+
+def expire_duplicate_pending_transfers(apps, schema_editor):
+    OrganizationOwnershipTransfer = apps.get_model('organization', 'OrganizationOwnershipTransfer')
+    pending = OrganizationOwnershipTransfer.objects.filter(status=0)
+    newest = pending.filter(organization_id=OuterRef('organization_id')).order_by('-created_at').values('pk')[:1]
+    pending.exclude(pk=Subquery(newest)).update(status=4)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0003_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organizationownershiptransfer',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Pending'), (1, 'Accepted'), (2, 'Rejected'), (3, 'Cancelled'), (4, 'Expired')], default=0, verbose_name='Status'),
+        ),
+        migrations.RunPython(flags_to_status, status_to_flags),
+        migrations.RunPython(expire_duplicate_pending_transfers, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='organizationownershiptransfer',
+            name='is_accepted',
+        ),
+        migrations.RemoveField(
+            model_name='organizationownershiptransfer',
+            name='is_cancelled',
+        ),
+        migrations.RemoveField(
+            model_name='organizationownershiptransfer',
+            name='is_expired',
+        ),
+        migrations.RemoveField(
+            model_name='organizationownershiptransfer',
+            name='is_rejected',
+        ),
+        migrations.AddConstraint(
+            model_name='organizationownershiptransfer',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 0)), fields=('organization',), name='otx_one_pending_per_org'),
+        ),
+    ]
@@ -1,12 +1,15 @@
 # Third-party imports
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
 # Local application imports
 from apps.common.models import TimeStampedModel
+from apps.organization.managers import OrganizationManager
 
 # Get the User model
 User = get_user_model()
@@ -83,6 +86,9 @@ class Organization(TimeStampedModel):
         blank=True,
     )
 
+    # Custom organization manager instance
+    objects = OrganizationManager()
+
     # Meta class for Organization model configuration
     class Meta:
         """Meta class for Organization model configuration.
@@ -93,6 +99,7 @@ class Organization(TimeStampedModel):
             ordering (list): Default ordering for model instances.
             db_table (str): The database table name.
             unique_together (tuple): Fields that together must be unique.
+            indexes (list): Database indexes for the model.
         """
 
         # Human-readable model name
@@ -110,6 +117,14 @@ class Organization(TimeStampedModel):
         # Ensure a user cannot create multiple organizations with the same name
         unique_together = ("owner", "name")
 
+        # Index the uppercased name with trigrams so icontains searches don't scan the table
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="org_name_trgm",
+            ),
+        ]
+
     # String representation of the organization
     def __str__(self) -> str:
         """Return a string representation of the organization.
@@ -164,10 +179,18 @@ class Organization(TimeStampedModel):
     def member_count(self) -> int:
         """Get the number of members in the organization.
 
+        Uses the count annotated by OrganizationQuerySet.with_member_count() when the
+        organization was loaded through it, and counts the members otherwise.
+
         Returns:
             int: The count of members in the organization.
         """
 
+        # Return the annotated number of members if the queryset provided it
+        if hasattr(self, "annotated_member_count"):
+            # Return the annotated count
+            return self.annotated_member_count
+
         # Return the number of members
         return self.members.count()
 
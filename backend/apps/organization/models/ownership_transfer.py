@@ -1,16 +1,15 @@
 # Third-party imports
-from django.contrib.auth import get_user_model
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 # Local application imports
 from apps.common.models import TimeStampedModel
+from apps.organization.managers import OrganizationOwnershipTransferManager
 from apps.organization.models.organization import Organization
 
-# Get the User model
-User = get_user_model()
-
 
 # Organization Ownership Transfer model
 class OrganizationOwnershipTransfer(TimeStampedModel):
@@ -26,22 +25,46 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
         current_owner (ForeignKey): The current owner of the organization.
         new_owner (ForeignKey): The proposed new owner of the organization.
         expiration_time (DateTimeField): When the transfer request expires.
-        is_accepted (BooleanField): Whether the transfer has been accepted.
-        is_rejected (BooleanField): Whether the transfer has been rejected.
-        is_expired (BooleanField): Whether the transfer request has expired.
-        is_cancelled (BooleanField): Whether the transfer has been cancelled.
+        status (PositiveSmallIntegerField): The state of the transfer request.
 
     Meta:
         verbose_name (str): Human-readable name for the model.
         verbose_name_plural (str): Human-readable plural name for the model.
         ordering (list): Default ordering for model instances.
         db_table (str): The database table name.
-        unique_together (tuple): Fields that together must be unique.
+        constraints (list): Database-level constraints for the model.
     """
 
     # Default expiration time for transfer requests (72 hours)
     DEFAULT_EXPIRATION_HOURS = 72
 
+    # Transfer status choices
+    class Status(models.IntegerChoices):
+        """Status choices for the ownership transfer model.
+
+        Choices:
+            PENDING: Transfer waiting for the new owner's answer.
+            ACCEPTED: Transfer accepted by the new owner.
+            REJECTED: Transfer rejected by the new owner.
+            CANCELLED: Transfer cancelled by the current owner.
+            EXPIRED: Transfer that expired before being answered.
+        """
+
+        # Pending status
+        PENDING = 0, _("Pending")
+
+        # Accepted status
+        ACCEPTED = 1, _("Accepted")
+
+        # Rejected status
+        REJECTED = 2, _("Rejected")
+
+        # Cancelled status
+        CANCELLED = 3, _("Cancelled")
+
+        # Expired status
+        EXPIRED = 4, _("Expired")
+
     # Organization being transferred
     organization = models.ForeignKey(
         Organization,
@@ -52,7 +75,7 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
 
     # Current owner of the organization
     current_owner = models.ForeignKey(
-        User,
+        settings.AUTH_USER_MODEL,
         verbose_name=_("Current Owner"),
         on_delete=models.CASCADE,
         related_name="initiated_ownership_transfers",
@@ -60,7 +83,7 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
 
     # New owner of the organization
     new_owner = models.ForeignKey(
-        User,
+        settings.AUTH_USER_MODEL,
         verbose_name=_("New Owner"),
         on_delete=models.CASCADE,
         related_name="received_ownership_transfers",
@@ -71,29 +94,15 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
         verbose_name=_("Expiration Time"),
     )
 
-    # Transfer status flags
-    is_accepted = models.BooleanField(
-        verbose_name=_("Accepted Status"),
-        default=False,
-    )
-
-    # Rejected status
-    is_rejected = models.BooleanField(
-        verbose_name=_("Rejected Status"),
-        default=False,
+    # Transfer status
+    status = models.PositiveSmallIntegerField(
+        verbose_name=_("Status"),
+        choices=Status.choices,
+        default=Status.PENDING,
     )
 
-    # Expired status
-    is_expired = models.BooleanField(
-        verbose_name=_("Expired Status"),
-        default=False,
-    )
-
-    # Cancelled status
-    is_cancelled = models.BooleanField(
-        verbose_name=_("Cancelled Status"),
-        default=False,
-    )
+    # Custom organization ownership transfer manager instance
+    objects = OrganizationOwnershipTransferManager()
 
     # Meta class for OrganizationOwnershipTransfer model configuration
     class Meta:
@@ -104,6 +113,7 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
             verbose_name_plural (str): Human-readable plural name for the model.
             ordering (list): Default ordering for model instances.
             db_table (str): The database table name.
+            constraints (list): Database-level constraints for the model.
         """
 
         # Human-readable model name
@@ -118,6 +128,16 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
         # Specify the database table name
         db_table = "organization_ownership_transfer"
 
+        # Allow a single pending transfer per organization, stored as status 0, which also
+        # indexes the pending transfers every transfer lookup filters on
+        constraints = [
+            models.UniqueConstraint(
+                fields=["organization"],
+                condition=models.Q(status=0),
+                name="otx_one_pending_per_org",
+            ),
+        ]
+
     # String representation of the transfer
     def __str__(self) -> str:
         """Return a string representation of the ownership transfer.
@@ -130,19 +150,54 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
         return f"Transfer of {self.organization.name} from {self.current_owner} to {self.new_owner}"
 
     # Check if the transfer request is currently active
-    @property
+    @cached_property
     def is_active(self) -> bool:
         """Check if the transfer request is currently active.
 
         An active transfer request is one that hasn't been accepted, rejected,
-        cancelled, or expired.
+        cancelled, or expired. The result is cached on the instance, as the status
+        is never changed in memory; transfers are deleted once resolved.
 
         Returns:
             bool: True if the transfer is active, False otherwise.
         """
 
         # Return True if the transfer is active, False otherwise
-        return not (self.is_accepted or self.is_rejected or self.is_cancelled or self.is_expired)
+        return self.status == self.Status.PENDING
+
+    # Get the pending transfer request for an organization, if any
+    @classmethod
+    def get_pending_transfer(
+        cls,
+        organization: Organization,
+    ) -> "tuple[OrganizationOwnershipTransfer | None, bool]":
+        """Get the pending transfer request for an organization, if any.
+
+        A pending transfer request is one that hasn't been accepted, rejected, cancelled
+        or marked as expired. It is fetched once and classified as active or expired in
+        Python, so callers that need both checks only query the database once.
+
+        Args:
+            organization (Organization): The organization to check.
+
+        Returns:
+            tuple[OrganizationOwnershipTransfer | None, bool]: The pending transfer request, or
+                None if none exists, and whether it is still before its expiration time.
+        """
+
+        # Get the pending transfer request
+        transfer = cls.objects.filter(
+            organization=organization,
+            status=cls.Status.PENDING,
+        ).first()
+
+        # If no pending transfer request exists
+        if transfer is None:
+            # Return no transfer request
+            return None, False
+
+        # Return the transfer request and whether it has not expired yet
+        return transfer, transfer.expiration_time > timezone.now()
 
     # Get the active transfer request for an organization, if any
     @classmethod
@@ -156,21 +211,11 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
             OrganizationOwnershipTransfer: The active transfer request, or None if none exists.
         """
 
-        try:
-            # Return the active transfer request
-            return cls.objects.get(
-                organization=organization,
-                is_accepted=False,
-                is_rejected=False,
-                is_cancelled=False,
-                is_expired=False,
-                expiration_time__gt=timezone.now(),
-            )
+        # Get the pending transfer request
+        transfer, is_unexpired = cls.get_pending_transfer(organization)
 
-        # If no active transfer request exists
-        except cls.DoesNotExist:
-            # Return None
-            return None
+        # Return the transfer request only if it has not expired yet
+        return transfer if is_unexpired else None
 
     # Get an expired transfer request for an organization, if any
     @classmethod
@@ -190,21 +235,11 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
             OrganizationOwnershipTransfer: The expired transfer request, or None if none exists.
         """
 
-        try:
-            # Return the expired transfer request
-            return cls.objects.get(
-                organization=organization,
-                is_accepted=False,
-                is_rejected=False,
-                is_cancelled=False,
-                is_expired=False,
-                expiration_time__lte=timezone.now(),
-            )
+        # Get the pending transfer request
+        transfer, is_unexpired = cls.get_pending_transfer(organization)
 
-        # If no expired transfer request exists
-        except cls.DoesNotExist:
-            # Return None
-            return None
+        # Return the transfer request only if it has expired
+        return None if is_unexpired else transfer
 
     # Clean up all expired transfer requests
     @classmethod
@@ -220,10 +255,7 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
 
         # Delete all expired transfers
         cls.objects.filter(
-            is_accepted=False,
-            is_rejected=False,
-            is_cancelled=False,
-            is_expired=False,
+            status=cls.Status.PENDING,
             expiration_time__lte=now,
         ).delete()
 
@@ -237,60 +269,72 @@ class OrganizationOwnershipTransfer(TimeStampedModel):
         # Instead of marking as expired, just delete the record
         self.delete()
 
-    # Accept the ownership transfer
-    def accept_transfer(self) -> None:
-        """Accept the ownership transfer.
+    # Delete this transfer record if it is still pending
+    def _delete_if_pending(self, error_message: str) -> None:
+        """Delete this transfer record if it is still pending.
+
+        The pending check and the deletion happen in a single DELETE statement, so two
+        concurrent requests cannot both resolve the same transfer.
+
+        Args:
+            error_message (str): The message of the error raised if the transfer is not pending.
 
-        Updates the organization's ownership and then deletes this transfer record.
+        Raises:
+            ValueError: If the transfer has already been resolved or deleted.
         """
 
-        # If the transfer request is not active
-        if not self.is_active:
-            # Error message
-            error_message = "Cannot accept an inactive transfer request."
+        # Delete this transfer record only if it is still pending
+        deleted_count, _ = OrganizationOwnershipTransfer.objects.filter(
+            pk=self.pk,
+            status=self.Status.PENDING,
+        ).delete()
 
+        # If the transfer request was not pending
+        if not deleted_count:
             # Raise a ValueError
             raise ValueError(error_message) from None
 
-        # Update the organization's owner
-        self.organization.owner = self.new_owner
-        self.organization.save()
+    # Accept the ownership transfer
+    def accept_transfer(self) -> None:
+        """Accept the ownership transfer.
 
-        # Delete this transfer record
-        self.delete()
+        Deletes this transfer record if it is still pending and updates the organization's
+        ownership in the same transaction. The owner is changed with a single targeted
+        UPDATE rather than a full save of the organization.
+        """
+
+        # Delete this transfer record and update the organization's owner together
+        with transaction.atomic():
+            # Delete this transfer record, failing if it is no longer pending
+            self._delete_if_pending("Cannot accept an inactive transfer request.")
+
+            # Update only the owner, bumping updated_at as a save would
+            Organization.objects.filter(pk=self.organization_id).update(
+                owner_id=self.new_owner_id,
+                updated_at=timezone.now(),
+            )
+
+        # Keep an already loaded organization in sync with the database
+        if type(self).organization.is_cached(self):
+            # Update the owner on the loaded organization
+            self.organization.owner_id = self.new_owner_id
 
     # Reject the ownership transfer
     def reject_transfer(self) -> None:
         """Reject the ownership transfer.
 
-        Deletes this transfer record.
+        Deletes this transfer record if it is still pending.
         """
 
-        # If the transfer request is not active
-        if not self.is_active:
-            # Error message
-            error_message = "Cannot reject an inactive transfer request."
-
-            # Raise a ValueError
-            raise ValueError(error_message) from None
-
-        # Delete this transfer record
-        self.delete()
+        # Delete this transfer record, failing if it is no longer pending
+        self._delete_if_pending("Cannot reject an inactive transfer request.")
 
     # Cancel the ownership transfer
     def cancel_transfer(self) -> None:
         """Cancel the ownership transfer.
 
-        Deletes this transfer record.
+        Deletes this transfer record if it is still pending.
         """
 
-        # If the transfer request is not active
-        if not self.is_active:
-            # Error message
-            error_message = "Cannot cancel an inactive transfer request."
-
-            # Raise a ValueError
-            raise ValueError(error_message) from None
-
-        # Delete this transfer record
-        self.delete()
+        # Delete this transfer record, failing if it is no longer pending
+        self._delete_if_pending("Cannot cancel an inactive transfer request.")
@@ -52,6 +52,7 @@ from apps.organization.serializers.organization_ownership_transfer_list import (
     OrganizationOwnershipTransferDetailSerializer,
     OrganizationOwnershipTransfersListResponseSerializer,
     OrganizationTransfersNotFoundResponseSerializer,
+    serialize_ownership_transfers,
 )
 from apps.organization.serializers.organization_update import (
     OrganizationUpdateErrorResponseSerializer,
@@ -98,4 +99,5 @@ __all__ = [
     "OrganizationUpdateErrorResponseSerializer",
     "OrganizationUpdateSerializer",
     "OrganizationUpdateSuccessResponseSerializer",
+    "serialize_ownership_transfers",
 ]
@@ -1,5 +1,6 @@
 # Third-party imports
 from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 # Local application imports
@@ -43,8 +44,10 @@ class OrganizationSerializer(serializers.ModelSerializer):
         help_text=_("Number of members in the organization."),
     )
 
-    # Owner serializer
-    owner = UserDetailSerializer(read_only=True)
+    # Owner field, serialized once per owner in a response
+    owner = serializers.SerializerMethodField(
+        help_text=_("The owner of the organization."),
+    )
 
     # Meta class for OrganizationSerializer configuration
     class Meta:
@@ -79,3 +82,29 @@ class OrganizationSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         ]
+
+    # Get the owner details
+    @extend_schema_field(UserDetailSerializer())
+    def get_owner(self, obj: Organization) -> dict:
+        """Get the owner details for the organization.
+
+        Owners are serialized once per response and shared between organizations with the
+        same owner, so lists of organizations don't rebuild the same user representation.
+
+        Args:
+            obj (Organization): The organization instance.
+
+        Returns:
+            dict: The serialized owner of the organization.
+        """
+
+        # Get the owners already serialized for this response
+        owner_representations = self.context.setdefault("owner_representations", {})
+
+        # Serialize the owner if it hasn't been serialized yet
+        if obj.owner_id not in owner_representations:
+            # Store the serialized owner
+            owner_representations[obj.owner_id] = UserDetailSerializer(obj.owner, context=self.context).data
+
+        # Return the serialized owner
+        return owner_representations[obj.owner_id]
@@ -78,8 +78,11 @@ class OrganizationCreateSerializer(serializers.ModelSerializer):
         # Get the user from the context
         user = self.context["request"].user
 
+        # Fetch the names of the user's organizations once for both checks, there are at most a few
+        owned_organization_names = list(user.owned_organizations.values_list("name", flat=True))
+
         # Check if the user has already created the maximum number of organizations
-        if user.owned_organizations.count() >= Organization.MAX_ORGANIZATIONS_PER_USER:
+        if len(owned_organization_names) >= Organization.MAX_ORGANIZATIONS_PER_USER:
             # Raise a validation error
             raise serializers.ValidationError(
                 {
@@ -93,7 +96,7 @@ class OrganizationCreateSerializer(serializers.ModelSerializer):
         organization_name = attrs.get("name")
 
         # Check if the user already has an organization with the same name
-        if organization_name and user.owned_organizations.filter(name=organization_name).exists():
+        if organization_name and organization_name in owned_organization_names:
             # Raise a validation error
             raise serializers.ValidationError(
                 {
@@ -158,6 +161,46 @@ class OrganizationCreateSuccessResponseSerializer(GenericResponseSerializer):
     )
 
 
+# Organization creation errors detail serializer
+class OrganizationCreateErrorsDetailSerializer(serializers.Serializer):
+    """Organization Creation Errors detail serializer.
+
+    Attributes:
+        name (list): Errors related to the name field.
+        description (list): Errors related to the description field.
+        website (list): Errors related to the website field.
+        non_field_errors (list): Non-field specific errors.
+    """
+
+    # Name field
+    name = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the name field."),
+    )
+
+    # Description field
+    description = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the description field."),
+    )
+
+    # Website field
+    website = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Errors related to the website field."),
+    )
+
+    # Non-field errors
+    non_field_errors = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Non-field specific errors (including limit warnings)."),
+    )
+
+
 # Organization creation error response serializer
 class OrganizationCreateErrorResponseSerializer(GenericResponseSerializer):
     """Organization creation error response serializer (for schema).
@@ -169,45 +212,6 @@ class OrganizationCreateErrorResponseSerializer(GenericResponseSerializer):
         errors (OrganizationCreateErrorsDetailSerializer): The errors detail serializer.
     """
 
-    # Nested serializer defining the structure of the actual errors
-    class OrganizationCreateErrorsDetailSerializer(serializers.Serializer):
-        """Organization Creation Errors detail serializer.
-
-        Attributes:
-            name (list): Errors related to the name field.
-            description (list): Errors related to the description field.
-            website (list): Errors related to the website field.
-            non_field_errors (list): Non-field specific errors.
-        """
-
-        # Name field
-        name = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the name field."),
-        )
-
-        # Description field
-        description = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the description field."),
-        )
-
-        # Website field
-        website = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Errors related to the website field."),
-        )
-
-        # Non-field errors
-        non_field_errors = serializers.ListField(
-            child=serializers.CharField(),
-            required=False,
-            help_text=_("Non-field specific errors (including limit warnings)."),
-        )
-
     # Override status_code from GenericResponseSerializer
     status_code = serializers.IntegerField(
         default=status.HTTP_400_BAD_REQUEST,
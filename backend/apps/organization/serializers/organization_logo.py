@@ -1,5 +1,5 @@
 # Third-party imports
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.uploadedfile import UploadedFile
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers, status
 
@@ -7,66 +7,82 @@ from rest_framework import serializers, status
 from apps.common.serializers import GenericResponseSerializer
 from apps.organization.serializers.organization import OrganizationSerializer
 
+# Content types accepted for organization logos
+ORGANIZATION_LOGO_CONTENT_TYPES = frozenset({"image/jpeg", "image/jpg", "image/png"})
 
-# Organization logo serializer
-class OrganizationLogoSerializer(serializers.Serializer):
-    """Organization logo upload serializer.
+# Maximum organization logo size in bytes (2MB)
+ORGANIZATION_LOGO_MAX_SIZE = 2 * 1024 * 1024
 
-    This serializer handles the upload of organization logos.
-    It validates that the file is a valid image (jpg/jpeg/png).
+# Error message for logos with an unsupported content type
+ORGANIZATION_LOGO_INVALID_FORMAT_ERROR = "Invalid image format. Please upload a valid image file (jpg/jpeg/png)."
 
-    Attributes:
-        logo (ImageField): The logo file to upload.
-    """
+# Error message for logos over the maximum size
+ORGANIZATION_LOGO_TOO_LARGE_ERROR = "Image file too large. Please upload a file smaller than 2MB."
 
-    # Logo field
-    logo = serializers.ImageField(
-        help_text=_("The organization logo file to upload (jpg/jpeg/png)."),
-    )
 
-    # Validate the logo field
-    def validate_logo(self, value: InMemoryUploadedFile) -> InMemoryUploadedFile:
-        """Validate the logo field.
+# Organization logo field
+class OrganizationLogoField(serializers.ImageField):
+    """Image field for organization logos.
+
+    The content type and size of the upload are checked before ImageField has Pillow
+    open and verify the image, so oversized or unsupported files are rejected without
+    being decoded.
+    """
 
-        This method validates that the file is a valid image (jpg/jpeg/png).
+    # Convert the uploaded file to its internal value
+    def to_internal_value(self, data: UploadedFile) -> UploadedFile:
+        """Validate the uploaded logo and return it.
 
         Args:
-            value (InMemoryUploadedFile): The uploaded file.
+            data (UploadedFile): The uploaded file.
 
         Returns:
-            InMemoryUploadedFile: The validated file.
+            UploadedFile: The validated file.
 
         Raises:
-            serializers.ValidationError: If the file is not a valid image.
+            serializers.ValidationError: If the file is not a valid image (jpg/jpeg/png).
             serializers.ValidationError: If the file is too large (>2MB).
         """
 
-        # Get the content type
-        content_type = value.content_type
-
-        # Check if the file is a valid image
-        if content_type not in ["image/jpeg", "image/jpg", "image/png"]:
-            # Raise a validation error
-            raise serializers.ValidationError(
-                [
-                    "Invalid image format. Please upload a valid image file (jpg/jpeg/png).",
-                ],
-            ) from None
-
-        # Get the file size (in bytes)
-        file_size = value.size
-
-        # Check if the file is too large (2MB)
-        if file_size > 2 * 1024 * 1024:
-            # Raise a validation error
-            raise serializers.ValidationError(
-                [
-                    "Image file too large. Please upload a file smaller than 2MB.",
-                ],
-            ) from None
-
-        # Return the value
-        return value
+        # Leave anything that isn't an uploaded file to ImageField's own error handling
+        if isinstance(data, UploadedFile):
+            # Check if the file has an accepted image content type
+            if data.content_type not in ORGANIZATION_LOGO_CONTENT_TYPES:
+                # Raise a validation error
+                raise serializers.ValidationError(
+                    [
+                        ORGANIZATION_LOGO_INVALID_FORMAT_ERROR,
+                    ],
+                ) from None
+
+            # Check if the file is too large (2MB)
+            if data.size > ORGANIZATION_LOGO_MAX_SIZE:
+                # Raise a validation error
+                raise serializers.ValidationError(
+                    [
+                        ORGANIZATION_LOGO_TOO_LARGE_ERROR,
+                    ],
+                ) from None
+
+        # Decode and verify the image
+        return super().to_internal_value(data)
+
+
+# Organization logo serializer
+class OrganizationLogoSerializer(serializers.Serializer):
+    """Organization logo upload serializer.
+
+    This serializer handles the upload of organization logos.
+    It validates that the file is a valid image (jpg/jpeg/png) of at most 2MB.
+
+    Attributes:
+        logo (OrganizationLogoField): The logo file to upload.
+    """
+
+    # Logo field
+    logo = OrganizationLogoField(
+        help_text=_("The organization logo file to upload (jpg/jpeg/png)."),
+    )
 
 
 # Organization logo success response serializer
@@ -1,14 +1,17 @@
+# Standard library imports
+from collections.abc import Iterable
+
 # Third-party imports
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers, status
 
 # Local application imports
-from apps.common.serializers import GenericResponseSerializer
+from apps.common.serializers import GenericResponseSerializer, build_field_readers
 from apps.organization.models import OrganizationOwnershipTransfer
-from apps.users.serializers import UserDetailSerializer
+from apps.users.serializers import UserDetailSerializer, serialize_user_detail
 
 
-# Organization Ownership Transfer Detail Serializer
+# Organization Ownership Transfer Detail Serializer, list responses are built by serialize_ownership_transfers()
 class OrganizationOwnershipTransferDetailSerializer(serializers.ModelSerializer):
     """Organization Ownership Transfer Detail Serializer.
 
@@ -82,6 +85,37 @@ class OrganizationOwnershipTransferDetailSerializer(serializers.ModelSerializer)
         read_only_fields = fields
 
 
+# Readers building each OrganizationOwnershipTransferDetailSerializer field from a transfer, in field order
+_OWNERSHIP_TRANSFER_READERS = build_field_readers(
+    OrganizationOwnershipTransferDetailSerializer,
+    {
+        "organization_name": lambda transfer: transfer.organization.name,
+        "current_owner": lambda transfer: serialize_user_detail(transfer.current_owner),
+        "new_owner": lambda transfer: serialize_user_detail(transfer.new_owner),
+    },
+)
+
+
+# Serialize ownership transfers for list responses
+def serialize_ownership_transfers(transfers: Iterable[OrganizationOwnershipTransfer]) -> list[dict]:
+    """Serialize ownership transfers into dictionaries shaped like OrganizationOwnershipTransferDetailSerializer.
+
+    All fields are read-only, so the representation is built directly from each transfer
+    instead of going through the nested ModelSerializer fields. The keys come from the
+    serializer's field list, so both stay in step. Fetch the transfers with
+    OrganizationOwnershipTransfer.objects.with_related() to avoid a query per relation.
+
+    Args:
+        transfers (Iterable[OrganizationOwnershipTransfer]): The transfers to serialize.
+
+    Returns:
+        list[dict]: The serialized ownership transfers.
+    """
+
+    # Build the representation of each transfer from the serializer's fields
+    return [{field: read(transfer) for field, read in _OWNERSHIP_TRANSFER_READERS.items()} for transfer in transfers]
+
+
 # Organization Ownership Transfers List Response Serializer
 class OrganizationOwnershipTransfersListResponseSerializer(GenericResponseSerializer):
     """Organization Ownership Transfers List Response Serializer.
@@ -5,9 +5,11 @@ from apps.organization.tasks.delete_user_agents_in_organization import (
 from apps.organization.tasks.delete_user_llms_in_organization import (
     delete_user_llms_in_organization,
 )
+from apps.organization.tasks.delete_vault_api_key import delete_vault_api_key
 
 # Exports
 __all__ = [
     "delete_user_agents_in_organization",
     "delete_user_llms_in_organization",
+    "delete_vault_api_key",
 ]
@@ -1,14 +1,13 @@
 # Standard library imports
-from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 
 # Third-party imports
-from celery import shared_task
+from celery import group, shared_task
 from django.db import transaction
 
 # Local application imports
-from apps.common.utils.vault import delete_api_key
 from apps.llms.models import LLM
+from apps.organization.tasks.delete_vault_api_key import delete_vault_api_key
 
 
 # Delete user LLMs in organization task
@@ -27,42 +26,32 @@ def delete_user_llms_in_organization(user_id: UUID, organization_id: UUID) -> in
         int: The number of LLM configurations deleted.
     """
 
-    # Get LLM configurations created by the user in the specified organization
-    llms = LLM.objects.filter(
-        user_id=user_id,
-        organization_id=organization_id,
+    # Get the IDs of LLM configurations created by the user in the specified organization in a single query
+    llm_ids = list(
+        LLM.objects.filter(
+            user_id=user_id,
+            organization_id=organization_id,
+        ).values_list("id", flat=True),
     )
 
     # Get the count of LLMs to be deleted
-    deleted_count = llms.count()
+    deleted_count = len(llm_ids)
 
     # If there are no LLMs to delete
     if deleted_count == 0:
         # Return early
         return 0
 
-    # Get the IDs of LLMs that need API key deletion from Vault
-    llm_ids_with_api_keys = list(llms.values_list("id", flat=True))
+    # Build a group with one Vault deletion subtask per LLM, fanned out across the worker pool
+    delete_api_keys = group(delete_vault_api_key.s("llm", str(llm_id)) for llm_id in llm_ids)
 
-    # Function to delete API keys in parallel
-    def delete_api_keys_in_parallel(llm_ids):
-        # If no LLM IDs are provided
-        if not llm_ids:
-            # Return early
-            return
-
-        # Use ThreadPoolExecutor to delete API keys in parallel without a for loop
-        with ThreadPoolExecutor(max_workers=min(8, len(llm_ids))) as executor:
-            # Map the delete_api_key function to each LLM ID
-            executor.map(lambda llm_id: delete_api_key("llm", str(llm_id)), llm_ids)
-
-    # Delete LLMs and API keys in a transaction
+    # Delete LLMs in a transaction
     with transaction.atomic():
-        # Delete all LLMs in a single bulk operation for efficiency
-        llms.delete()
+        # Delete the fetched LLMs in a single bulk operation for efficiency
+        LLM.objects.filter(id__in=llm_ids).delete()
 
-        # Delete API keys from Vault for Gemini LLMs in parallel
-        delete_api_keys_in_parallel(llm_ids_with_api_keys)
+        # Delete the API keys from Vault only once the LLMs are gone for good
+        transaction.on_commit(delete_api_keys.apply_async)
 
     # Return the number of LLM configurations deleted
     return deleted_count
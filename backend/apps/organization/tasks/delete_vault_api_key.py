@@ -0,0 +1,37 @@
+# Third-party imports
+from celery import shared_task
+
+# Local application imports
+from apps.common.utils.vault import delete_api_key
+
+# Maximum number of attempts to delete an API key from Vault after the first one fails
+DELETE_VAULT_API_KEY_MAX_RETRIES = 5
+
+
+# Delete Vault API key task
+@shared_task(
+    bind=True,
+    name="organization.delete_vault_api_key",
+    max_retries=DELETE_VAULT_API_KEY_MAX_RETRIES,
+)
+def delete_vault_api_key(self, entity_type: str, entity_id: str) -> bool:
+    """Delete a single API key from Vault.
+
+    The Vault client reports failures through its return value rather than raising, so a
+    failed deletion is retried with an exponential backoff until the retries run out.
+
+    Args:
+        entity_type (str): The type of entity (e.g., 'llm', 'provider').
+        entity_id (str): The ID of the entity.
+
+    Returns:
+        bool: True if the API key was deleted successfully.
+    """
+
+    # Delete the API key from Vault
+    if not delete_api_key(entity_type, entity_id):
+        # Retry with an exponential backoff
+        raise self.retry(countdown=2**self.request.retries)
+
+    # Return True once the API key has been deleted
+    return True
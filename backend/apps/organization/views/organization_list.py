@@ -94,8 +94,8 @@ class OrganizationListView(APIView):
             Response: The HTTP response object containing the list of organizations.
         """
 
-        # Get all organizations owned by the user
-        organizations = Organization.objects.filter(owner=request.user)
+        # Get all organizations owned by the user, counting their members in the same query
+        organizations = Organization.objects.filter(owner=request.user).with_member_count()
 
         # Serialize the organizations for the response body
         response_serializer = OrganizationSerializer(organizations, many=True)
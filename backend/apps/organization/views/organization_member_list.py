@@ -101,8 +101,8 @@ class OrganizationMemberListView(APIView):
         # Get all organizations owned by the user
         owned_organizations = Organization.objects.filter(owner=request.user)
 
-        # Combine the two querysets without duplicates
-        organizations = (member_organizations | owned_organizations).distinct()
+        # Combine the two querysets without duplicates, counting members in the same query
+        organizations = (member_organizations | owned_organizations).distinct().with_member_count()
 
         # Serialize the organizations for the response body
         response_serializer = OrganizationSerializer(organizations, many=True)
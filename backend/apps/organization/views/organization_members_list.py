@@ -17,7 +17,7 @@ from apps.organization.serializers import (
     OrganizationNotFoundResponseSerializer,
     OrganizationNotOwnerResponseSerializer,
 )
-from apps.users.serializers import UserDetailSerializer
+from apps.users.serializers import serialize_user_detail
 
 # Get the User model
 User = get_user_model()
@@ -76,9 +76,12 @@ class OrganizationMembersListView(APIView):
         # Get the organization or return 404
         organization = get_object_or_404(Organization, id=organization_id)
 
+        # Get all members of the organization in a single query
+        members = list(organization.members.all())
+
         # Check if the authenticated user is the owner or a member
         is_owner = organization.owner == request.user
-        is_member = request.user in organization.members.all()
+        is_member = request.user in members
 
         # If the user is neither the owner nor a member
         if not (is_owner or is_member):
@@ -88,14 +91,8 @@ class OrganizationMembersListView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Get all members of the organization
-        members = organization.members.all()
-
-        # Serialize the members for the response body
-        response_serializer = UserDetailSerializer(members, many=True)
-
         # Return 200 OK with the serialized members data
         return Response(
-            response_serializer.data,
+            [serialize_user_detail(member) for member in members],
             status=status.HTTP_200_OK,
         )
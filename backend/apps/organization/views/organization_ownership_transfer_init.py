@@ -1,5 +1,6 @@
 # Third-party imports
 from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
@@ -137,11 +138,13 @@ class OrganizationOwnershipTransferInitView(APIView):
             # Get the new owner
             new_owner = serializer.get_user()
 
-            # Check if there's an active transfer for this organization
-            active_transfer = OrganizationOwnershipTransfer.get_active_transfer(
+            # Get the pending transfer for this organization, classified as active or expired
+            pending_transfer, is_unexpired = OrganizationOwnershipTransfer.get_pending_transfer(
                 organization,
             )
-            if active_transfer:
+
+            # Check if there's an active transfer for this organization
+            if pending_transfer and is_unexpired:
                 # Return an error if there's already an active transfer
                 return Response(
                     {
@@ -155,26 +158,38 @@ class OrganizationOwnershipTransferInitView(APIView):
                 )
 
             # Check if there's an expired transfer that hasn't been marked as expired yet
-            expired_transfer = OrganizationOwnershipTransfer.get_expired_transfer(
-                organization,
-            )
-            if expired_transfer:
+            if pending_transfer:
                 # Delete the expired transfer
-                expired_transfer.delete()
-                expired_transfer = None
+                pending_transfer.delete()
 
             # Calculate the expiration time (72 hours from now)
             expiration_time = timezone.now() + timezone.timedelta(
                 hours=OrganizationOwnershipTransfer.DEFAULT_EXPIRATION_HOURS,
             )
 
-            # Create a new transfer request
-            transfer = OrganizationOwnershipTransfer.objects.create(
-                organization=organization,
-                current_owner=request.user,
-                new_owner=new_owner,
-                expiration_time=expiration_time,
-            )
+            try:
+                # Create a new transfer request in a savepoint, as the database allows one pending transfer
+                with transaction.atomic():
+                    # Create the transfer request
+                    transfer = OrganizationOwnershipTransfer.objects.create(
+                        organization=organization,
+                        current_owner=request.user,
+                        new_owner=new_owner,
+                        expiration_time=expiration_time,
+                    )
+
+            except IntegrityError:
+                # Return an error if a concurrent request created a pending transfer first
+                return Response(
+                    {
+                        "errors": {
+                            "non_field_errors": [
+                                "There is already an active ownership transfer for this organization.",
+                            ],
+                        },
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
             # Get scheme and domain from settings
             scheme = settings.ACTIVATION_SCHEME
@@ -11,9 +11,9 @@ from apps.common.renderers import GenericJSONRenderer
 from apps.organization.models import Organization, OrganizationOwnershipTransfer
 from apps.organization.serializers import (
     OrganizationAuthErrorResponseSerializer,
-    OrganizationOwnershipTransferDetailSerializer,
     OrganizationOwnershipTransfersListResponseSerializer,
     OrganizationTransfersNotFoundResponseSerializer,
+    serialize_ownership_transfers,
 )
 
 
@@ -86,15 +86,12 @@ class OrganizationOwnershipTransfersListView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # Get all transfers for the organization
-        transfers = OrganizationOwnershipTransfer.objects.filter(organization=organization)
-
-        # Serialize the transfers for the response body
-        response_serializer = OrganizationOwnershipTransferDetailSerializer(transfers, many=True)
+        # Get all transfers for the organization with the relations embedded in the response
+        transfers = OrganizationOwnershipTransfer.objects.with_related().filter(organization=organization)
 
         # Return 200 OK with the serialized transfers data
         return Response(
-            response_serializer.data,
+            serialize_ownership_transfers(transfers),
             status=status.HTTP_200_OK,
         )
 
@@ -144,14 +141,11 @@ class UserReceivedOwnershipTransfersListView(APIView):
             Response: The HTTP response object containing the list of transfers.
         """
 
-        # Get all transfers where the authenticated user is the intended new owner
-        transfers = OrganizationOwnershipTransfer.objects.filter(new_owner=request.user)
-
-        # Serialize the transfers for the response body
-        response_serializer = OrganizationOwnershipTransferDetailSerializer(transfers, many=True)
+        # Get all transfers where the authenticated user is the intended new owner with their relations
+        transfers = OrganizationOwnershipTransfer.objects.with_related().filter(new_owner=request.user)
 
         # Return 200 OK with the serialized transfers data
         return Response(
-            response_serializer.data,
+            serialize_ownership_transfers(transfers),
             status=status.HTTP_200_OK,
         )
@@ -1,7 +1,9 @@
 # Third-party imports
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils.translation import gettext_lazy as _
 
 # Local application imports
@@ -85,6 +87,7 @@ class User(AbstractUser, TimeStampedModel):
             verbose_name_plural (str): Human-readable plural name for the model.
             ordering (list): Default ordering for model instances.
             db_table (str): The database table name.
+            indexes (list): Database indexes for the model.
         """
 
         # Human-readable model name
@@ -99,6 +102,18 @@ class User(AbstractUser, TimeStampedModel):
         # Specify the database table name
         db_table = "users_user"
 
+        # Index the uppercased email and username with trigrams so icontains searches don't scan the table
+        indexes = [
+            GinIndex(
+                OpClass(Upper("email"), name="gin_trgm_ops"),
+                name="user_email_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="user_username_trgm",
+            ),
+        ]
+
     # Property for the user's full name
     @property
     def full_name(self) -> str:
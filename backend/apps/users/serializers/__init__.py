@@ -31,7 +31,7 @@ from apps.users.serializers.user_deletion import (
     UserDeletionRequestSuccessResponseSerializer,
     UserDeletionRequestUnauthorizedResponseSerializer,
 )
-from apps.users.serializers.user_detail import UserDetailSerializer
+from apps.users.serializers.user_detail import UserDetailSerializer, serialize_user_detail
 from apps.users.serializers.user_login import (
     UserLoginErrorResponseSerializer,
     UserLoginResponseSerializer,
@@ -122,4 +122,5 @@ __all__ = [
     "UserReloginErrorResponseSerializer",
     "UserReloginResponseSerializer",
     "UserReloginSerializer",
+    "serialize_user_detail",
 ]
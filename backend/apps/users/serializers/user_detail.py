@@ -3,6 +3,9 @@ from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+# Local application imports
+from apps.common.serializers import build_field_readers
+
 # Get the user model
 User = get_user_model()
 
@@ -74,3 +77,25 @@ class UserDetailSerializer(serializers.ModelSerializer):
 
         # Return the avatar URL
         return obj.avatar_url
+
+
+# Readers building each UserDetailSerializer field from a user, keyed in the serializer's field order
+_USER_DETAIL_READERS = build_field_readers(UserDetailSerializer)
+
+
+# Serialize a user like UserDetailSerializer
+def serialize_user_detail(user: User) -> dict:
+    """Serialize a user into a dictionary shaped like UserDetailSerializer output.
+
+    List responses that embed many users use this to skip building serializer fields
+    for every row. The keys come from the serializer's field list, so both stay in step.
+
+    Args:
+        user (User): The user to serialize.
+
+    Returns:
+        dict: The serialized user.
+    """
+
+    # Build the user representation from the serializer's fields
+    return {field: read(user) for field, read in _USER_DETAIL_READERS.items()}